@@ -0,0 +1,277 @@
+import importlib
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+fmpy is a Python SDK for the Financial Modeling Prep API. Importing the package is cheap:
+submodules and endpoint functions are loaded on first access, e.g.
+
+    >>> import fmpy
+    >>> df = fmpy.get_stock_historical_price('AAPL')
+
+imports fmpy.stock_price only when get_stock_historical_price is looked up,
+and the API key is resolved only when the first request is built (see fmpy.config).
+"""
+
+# endpoint module -> public functions, resolved by __getattr__ on first access
+_ENDPOINTS = {
+    'advanced_data': (
+        'get_standard_industrial_classification',
+        'get_standard_industrial_classification_list',
+        'get_commitment_of_traders_analysis',
+        'get_commitment_of_traders_report',
+        'get_cod_trading_symbols_list',
+    ),
+    'company_information': (
+        'get_company_profile',
+        'get_key_executives',
+        'get_stock_peers',
+        'get_market_capitalization',
+        'get_symbol_change',
+        'get_company_outlook',
+        'get_delisted_companies',
+        'get_company_core_information',
+        'get_nyse_holidays_and_trading_hours',
+    ),
+    'crypto_and_forex_and_commodities': (
+        'get_available_crypto_symbols',
+        'get_historical_crypto_prices',
+        'get_all_real_time_crypto_prices',
+        'get_real_time_crypto_price',
+        'get_available_commodities_symbols',
+        'get_currency_exchange_rates',
+        'get_historical_commodity_prices',
+        'get_historical_forex_prices',
+        'get_all_real_time_commodity_prices',
+        'get_currency_exchange_rate_single',
+        'get_currency_real_time_price',
+        'get_real_time_commodity_price',
+    ),
+    'economics': (
+        'get_market_risk_premium',
+        'get_treasury_rates',
+        'get_economic_indicator',
+    ),
+    'esg_score': (
+        'get_esg_score',
+        'get_company_esg_risk_ratings',
+        'get_esg_benchmarking_by_sector_and_year',
+    ),
+    'euronext': (
+        'get_available_euronext_symbols',
+        'get_historical_euronext_prices',
+        'get_all_real_time_euronext_prices',
+        'get_real_time_edf_price',
+    ),
+    'fund_holdings': (
+        'get_etf_expense_ratio',
+        'get_institutional_holders',
+        'get_13F_list',
+        'get_form_13F',
+        'get_cusip_mapper',
+        'get_mutual_fund_holders',
+        'get_etf_sector_weightings',
+        'get_cik_by_name',
+        'get_etf_country_weightings',
+        'get_etf_stock_exposure',
+        'get_company_name_by_cik',
+        'get_filing_dates_by_cik',
+    ),
+    'historical_number_of_employees': (
+        'get_historical_number_of_employees',
+    ),
+    'insider_trading': (
+        'get_insider_trading',
+        'get_fail_to_deliver',
+        'get_transaction_types_list',
+        'get_cik_mapper',
+        'get_insider_roaster',
+        'get_insider_roaster_statistics',
+        'get_insider_trading_rss_feed',
+    ),
+    'institutional_stock_ownership': (
+        'get_institutional_stock_ownership',
+        'get_institutional_ownership_by_holder',
+        'get_institutional_holdings_portfolio_positions_summary',
+        'get_institutional_holder_rss_feed',
+        'get_institutional_holders_list',
+    ),
+    'market_indexes': (
+        'get_all_major_indexes',
+        'get_list_of_sp500_companies',
+        'get_historical_sp500_constituents_list',
+        'get_real_time_stock_market_index',
+        'get_available_historical_stock_index_prices',
+        'get_historical_stock_index_prices',
+        'get_list_of_dow_jones_companies',
+        'get_list_of_nasdaq100_companies',
+        'get_historical_dow_jones_constituents_list',
+    ),
+    'market_performance': (
+        'get_sectors_pe_ratio',
+        'get_industries_pe_ratio',
+        'get_stock_market_sector_performance',
+        'get_most_active_stock_companies',
+        'get_most_gainer_stock_companies',
+        'get_most_losers_stock_companies',
+    ),
+    'price_target': (
+        'get_price_target',
+        'get_price_target_summary',
+        'get_price_target_by_analyst_company',
+        'get_price_target_by_analyst_name',
+        'get_price_target_consensus',
+        'get_price_target_rss_feed',
+    ),
+    'private_companies_fundraising_data': (
+        'get_crowdfunding_offerings_rss_feed',
+        'get_crowdfunding_offerings_by_cik',
+        'get_crowdfunding_offerings_company_search',
+        'get_equity_offerings_fundraising_rss_feed',
+        'get_equity_fundraising_by_cik',
+        'get_equity_offerings_fundraising_company_search',
+    ),
+    'senate_trading': (
+        'get_senate_trading',
+        'get_senate_disclosure',
+        'get_senate_trading_rss_feed',
+        'get_senate_disclosure_rss_feed',
+    ),
+    'stock_calendars': (
+        'get_earnings_calendar',
+        'get_ipo_calendar',
+        'get_historical_dividends',
+        'get_dividend_calendar',
+        'get_economic_calendar',
+        'get_stock_split_calendar',
+        'get_earnings_calendar_confirmed',
+        'get_historical_earning_calendar',
+        'get_ipo_calendar_confirmed',
+        'get_ipo_calendar_with_prospectus',
+    ),
+    'stock_fundamentals': (
+        'get_financial_statements_list',
+        'get_income_statement',
+        'get_cashflow_statement',
+        'get_balance_sheet_statement',
+        'get_sec_filings',
+        'get_company_notes',
+        'get_shares_float_all',
+        'get_shares_float_symbol',
+        'get_earning_call_transcript',
+        'get_revenue_geographic_by_segments',
+        'get_sales_and_revenue_by_segments',
+        'get_sec_rss_feed',
+        'get_financial_reports_dates',
+        'get_earning_call_transcript_dates',
+        'get_reports_on_form_10k',
+        'get_rss_feed_8k_forms',
+    ),
+    'stock_fundamentals_analysis': (
+        'get_company_financial_ratios',
+        'get_company_rating',
+        'get_company_key_metrics',
+        'get_discounted_cash_flow',
+        'get_cashflow_statement_growth',
+        'get_company_enterprise_value',
+        'get_company_financial_growth',
+        'get_historical_discounted_cashflow',
+        'get_income_statement_growth',
+        'get_balance_sheet_statement_growth',
+    ),
+    'stock_list': (
+        'get_symbols_list',
+        'get_etf_list',
+        'get_tradable_symbols_list',
+    ),
+    'stock_look_up_tool': (
+        'get_company_search',
+        'get_company_search_',
+        'get_list_of_countries',
+        'stock_screener',
+    ),
+    'stock_news': (
+        'get_fmp_articles',
+        'get_stock_news',
+        'get_crypto_news',
+        'get_forex_news',
+        'get_general_news',
+        'get_press_releases',
+        'get_stock_news_with_sentiment',
+    ),
+    'stock_price': (
+        'get_stock_price_change',
+        'get_technical_indicator',
+        'get_prices_of_otc_companies',
+        'get_stock_price_list',
+        'get_historical_stock_split',
+        'get_stock_historical_price',
+        'get_stock_historical_panel',
+        'get_company_quote',
+        'get_quote_snapshot',
+        'get_real_time_price',
+        'get_real_time_volume',
+        'get_survivorship_bias_free_eod',
+    ),
+    'stock_statistics': (
+        'get_social_sentiment',
+        'get_stock_grade',
+        'get_earning_surprises',
+        'get_analyst_estimates',
+        'get_merger_and_acquisition',
+    ),
+    'tsx': (
+        'get_available_tsx_symbols',
+        'get_historical_tsx_prices',
+        'get_all_real_time_tsx_prices',
+        'get_real_time_tsx_price',
+    ),
+    'upgrades_and_downgrades': (
+        'get_upgrades_and_downgrades',
+        'get_upgrades_and_downgrades_by_company',
+        'get_upgrades_and_downgrades_rss_feed',
+        'get_upgrades_and_downgrades_consensus',
+    ),
+}
+
+_FUNCTIONS = {name: module for module, names in _ENDPOINTS.items() for name in names}
+
+_SUBMODULES = {
+    'aio',
+    'bulk',
+    'bulk_fundamentals',
+    'cache',
+    'client',
+    'config',
+    'jobs',
+    'pagination',
+    'poller',
+    'price_store',
+    'rate_limit',
+    'schemas',
+    'stream',
+    'screener',
+    'symbol_index',
+    'utils',
+    *_ENDPOINTS,
+}
+
+__all__ = sorted(_FUNCTIONS)
+
+
+def __getattr__(name: str):
+    if name in _FUNCTIONS:
+        value = getattr(importlib.import_module(f'.{_FUNCTIONS[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache in the module namespace, later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _FUNCTIONS.keys() | _SUBMODULES)
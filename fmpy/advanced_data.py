@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 from pandas import DataFrame, Series
 from types import SimpleNamespace
 from typing import Union, Optional, Any
@@ -66,10 +66,7 @@ def get_standard_industrial_classification(symbol: Optional[str] = None, cik: Op
         url = f"{local_base}?cik={cik}&apikey={api_key}"
     else:
         url = f"{local_base}?sicCode={sic_code}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         if not get_all:
             data = convert_dict_keys_to_snake_case(json_data[0])
@@ -81,6 +78,7 @@ def get_standard_industrial_classification(symbol: Optional[str] = None, cik: Op
     return json_data
 
 
+@memoize()
 def get_standard_industrial_classification_list(as_pandas: bool = True,
                                                 industry_title: Optional[str] = None,
                                                 sic_code: Optional[str] = None,
@@ -115,10 +113,7 @@ def get_standard_industrial_classification_list(as_pandas: bool = True,
         url += f"&{industry_title}"
     elif sic_code is not None:
         url += f"&{sic_code}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'sic_code')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -128,10 +123,7 @@ def get_standard_industrial_classification_list(as_pandas: bool = True,
 def get_cod_trading_symbols_list(as_pandas: bool = True,
                                  *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v4}commitment_of_traders_report/list?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'trading_symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -0,0 +1,193 @@
+import asyncio
+import inspect
+from functools import wraps
+from types import ModuleType
+
+from .. import config
+from ..utils import APIRequestError
+from .. import client as _sync_client
+from ..cache import is_bypassed
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This package provides asyncio counterparts of the endpoint modules, e.g.
+
+    >>> from fmpy.aio import stock_price
+    >>> df = await stock_price.get_stock_historical_price('AAPL')
+
+Every coroutine runs the synchronous endpoint function with the HTTP round-trip swapped for a shared
+aiohttp session, so URL building and the process_dataframe post-processing are exactly the same
+and outputs are identical. The number of requests in flight is bounded by a semaphore.
+Requires the optional dependency aiohttp.
+"""
+
+__all__ = [
+    'AsyncClient',
+    'configure',
+    'get_client',
+    'close',
+    'run',
+]
+
+# Runtime overrides of configure(), the defaults are read from fmpy.config when a client is created
+_settings = {}
+
+_clients = {}
+
+
+class _PendingRequest(BaseException):
+    # BaseException so that broad `except Exception` blocks in endpoint functions don't swallow it
+    def __init__(self, url):
+        self.url = url
+        super().__init__(url)
+
+
+class AsyncClient:
+
+    def __init__(self, max_concurrency: int = None, timeout: float = None):
+        if max_concurrency is None:
+            max_concurrency = _settings.get('max_concurrency', config.get('max_concurrency', 16))
+        if timeout is None:
+            timeout = _settings.get('timeout', config.get('timeout', None))
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("fmpy.aio requires aiohttp, install it with 'pip install aiohttp'") from e
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def get_content(self, url: str) -> bytes:
+        import aiohttp
+        cache = _sync_client.get_cache()
+        if cache is not None and not is_bypassed():
+            content = cache.get(url)
+            if content is not None:
+                return content
+        _sync_client._init()
+        max_retries = _sync_client._settings['max_retries']
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after = None
+            async with self._semaphore:
+                rate_limiter = _sync_client.get_rate_limiter()
+                if rate_limiter is not None:
+                    await rate_limiter.acquire_async()
+                try:
+                    async with self.session.get(url) as response:
+                        if response.status == 200:
+                            content = await response.read()
+                            if cache is not None and not _sync_client._is_error_body(content):
+                                cache.set(url, content)
+                            return content
+                        if response.status not in _sync_client.RETRY_STATUS_CODES or attempt > max_retries:
+                            raise APIRequestError(response.status, attempts=attempt, body=await response.text())
+                        retry_after = response.headers.get('Retry-After')
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt > max_retries:
+                        raise
+            # back off outside the semaphore so that other requests can proceed meanwhile
+            await asyncio.sleep(_sync_client.retry_delay(attempt, retry_after))
+
+    async def get_json(self, url: str):
+        return _sync_client.loads(await self.get_content(url))
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def configure(max_concurrency: int = None, timeout: float = None):
+    """
+    Parameters
+    ----------
+    max_concurrency: (int) maximum number of requests in flight at the same time
+    timeout: (float) total seconds per request, None waits forever
+
+    Applies to clients created afterwards, existing clients keep their settings.
+    """
+    if max_concurrency is not None:
+        _settings['max_concurrency'] = max_concurrency
+    if timeout is not None:
+        _settings['timeout'] = timeout
+
+
+def get_client() -> AsyncClient:
+    """Returns the shared client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        for closed_loop in [key for key in _clients if key.is_closed()]:
+            del _clients[closed_loop]
+        client = _clients[loop] = AsyncClient()
+    return client
+
+
+async def close():
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+async def run(func, *args, client: AsyncClient = None, **kwargs):
+    """
+    Runs a synchronous endpoint function without blocking the event loop.
+    The function is executed until it asks for URLs that haven't been fetched yet, these URLs are then
+    fetched concurrently and the function is replayed with the stored responses.
+    All URLs requested in the same pass, e.g. by the worker threads of fmpy.bulk.map, are fetched together,
+    so a function issuing its requests concurrently needs a single round-trip per pass.
+    """
+    client = client or get_client()
+    contents = {}
+    pending = set()
+
+    def transport(url):
+        if url not in contents:
+            pending.add(url)
+            raise _PendingRequest(url)
+        # decode on every replay so that mutations of a previous pass can't leak into the next one
+        return _sync_client.loads(contents[url])
+
+    while True:
+        token = _sync_client._transport.set(transport)
+        try:
+            return func(*args, **kwargs)
+        except _PendingRequest as request:
+            pending.add(request.url)
+        finally:
+            _sync_client._transport.reset(token)
+        urls = list(pending)
+        pending.clear()
+        fetched = await asyncio.gather(*(client.get_content(url) for url in urls))
+        contents.update(zip(urls, fetched))
+
+
+def coroutine(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def wrap_module(module: ModuleType) -> dict:
+    """Returns async wrappers of all public endpoint functions of a synchronous module."""
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name, obj in vars(module).items()
+                 if inspect.isfunction(obj) and obj.__module__ == module.__name__ and name.startswith('get_')]
+    return {name: coroutine(getattr(module, name)) for name in names}
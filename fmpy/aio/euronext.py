@@ -0,0 +1,11 @@
+from .. import euronext as _sync
+from . import wrap_module
+
+__doc__ = """
+Asyncio counterpart of fmpy.euronext, every endpoint function is available as a coroutine.
+"""
+
+_functions = wrap_module(_sync)
+globals().update(_functions)
+
+__all__ = list(_functions)
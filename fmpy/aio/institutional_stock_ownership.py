@@ -0,0 +1,11 @@
+from .. import institutional_stock_ownership as _sync
+from . import wrap_module
+
+__doc__ = """
+Asyncio counterpart of fmpy.institutional_stock_ownership, every endpoint function is available as a coroutine.
+"""
+
+_functions = wrap_module(_sync)
+globals().update(_functions)
+
+__all__ = list(_functions)
@@ -0,0 +1,77 @@
+import contextvars
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Tuple
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module provides helpers to run per-symbol endpoint functions concurrently on a bounded thread pool.
+
+Example:
+    >>> from fmpy import bulk
+    >>> from fmpy.market_indexes import get_list_of_sp500_companies
+    >>> from fmpy.company_information import get_company_profile
+    >>> symbols = get_list_of_sp500_companies().index
+    >>> results, errors = bulk.map(get_company_profile, symbols, max_workers=32)
+    >>> profiles = bulk.concat(results)
+"""
+
+__all__ = [
+    'map',
+    'concat',
+]
+
+
+def map(func: Callable, symbols: Iterable[str], *args, max_workers: int = 16, **kwargs) -> Tuple[dict, dict]:
+    """
+    Calls func(symbol, *args, **kwargs) for every symbol on a thread pool.
+
+    Parameters
+    ----------
+    func: (Callable) endpoint function taking the symbol as first argument, e.g. get_company_profile
+    symbols: (Iterable) of ticker symbols (or CIKs, names, ... whatever func expects first)
+    max_workers: (int) maximum number of concurrent requests. Keep it at or below the 'pool_maxsize'
+                 of fmpy.client, otherwise surplus connections are not reused
+    args, kwargs: passed on to every func call
+
+    Returns
+    -------
+    results: (dict) symbol -> return value of func for all successful calls, in input order
+    errors: (dict) symbol -> raised exception for all failed calls, in input order
+    """
+    symbols = list(dict.fromkeys(symbols))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # each call runs in a copy of the caller's context, so that fmpy.aio can serve the worker threads
+        futures = [executor.submit(contextvars.copy_context().run, func, symbol, *args, **kwargs)
+                   for symbol in symbols]
+
+    results = {}
+    errors = {}
+    for symbol, future in zip(symbols, futures):
+        exception = future.exception()
+        if not isinstance(exception, (Exception, type(None))):
+            # e.g. KeyboardInterrupt or the pending request of fmpy.aio, they end the whole map
+            raise exception
+        if exception is not None:
+            errors[symbol] = exception
+        else:
+            results[symbol] = future.result()
+    return results, errors
+
+
+def concat(results: dict, name: str = 'symbol'):
+    """
+    Combines the results of map into a single pandas object.
+    Series results (e.g. company profiles) become the rows of a DataFrame indexed by symbol,
+    DataFrame results (e.g. income statements) are stacked with the symbol as outer index level.
+    """
+    if len(results) == 0:
+        return pd.DataFrame()
+    values = list(results.values())
+    if all(isinstance(value, pd.Series) for value in values):
+        df = pd.DataFrame(values, index=pd.Index(list(results.keys()), name=name))
+        return df
+    return pd.concat(results, names=[name])
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from typing import Iterable, Tuple
+
+from . import bulk
+from .client import get_json
+from .utils import base_url_v3, api_key, to_snake_case, _import_pyarrow
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module loads the fundamentals of a whole symbol universe into one long-format Parquet store, e.g.
+
+    >>> from fmpy import bulk_fundamentals
+    >>> errors = bulk_fundamentals.load(symbols, './fundamentals', period='quarter')
+    >>> df = bulk_fundamentals.read('./fundamentals', statements=['income_statement'], symbols=['AAPL'])
+
+Every (statement, symbol) pair is one request, fetched concurrently through the shared client, so the
+rate limit and the response cache apply. Its rows (symbol, date, period, field, value) are written to
+<path>/frequency=<quarter or annual>/statement=<statement>/<symbol>.parquet right away, a Parquet dataset
+partitioned by frequency and statement type. Pairs already in the store are skipped, so an interrupted load
+continues where it stopped. The limit of every frequency is recorded in <path>/_store.json, a load with
+another limit is refused instead of mixing histories of different lengths.
+Requires the optional dependency pyarrow.
+"""
+
+__all__ = [
+    'STATEMENTS',
+    'load',
+    'read',
+]
+
+# statement type -> endpoint, the same endpoints as get_income_statement, get_balance_sheet_statement,
+# get_cashflow_statement, get_company_key_metrics and get_company_financial_ratios
+STATEMENTS = {
+    'income_statement': 'income-statement',
+    'balance_sheet_statement': 'balance-sheet-statement',
+    'cashflow_statement': 'cash-flow-statement',
+    'key_metrics': 'key-metrics',
+    'financial_ratios': 'ratios',
+}
+
+# descriptive keys of the records, all other keys are fields
+_META = {'symbol', 'date', 'period', 'reportedCurrency', 'cik', 'fillingDate', 'filingDate', 'acceptedDate',
+         'calendarYear', 'link', 'finalLink'}
+
+_COLUMNS = ['symbol', 'date', 'period', 'field', 'value']
+
+
+def _file(path: str, period: str, statement: str, symbol: str) -> str:
+    return os.path.join(path, f"frequency={period}", f"statement={statement}", f"{symbol}.parquet")
+
+
+def _check_limit(path: str, period: str, limit: int):
+    """Records the limit of the period in the manifest of the store, raises if it was loaded with another."""
+    manifest = os.path.join(path, '_store.json')
+    limits = {}
+    if os.path.isfile(manifest):
+        with open(manifest) as file:
+            limits = json.load(file)
+    if limits.get(period, limit) != limit:
+        raise ValueError(f"The {period} statements in {path} were loaded with limit={limits[period]}, "
+                         f"pass the same limit or another path")
+    if period not in limits:
+        limits[period] = limit
+        os.makedirs(path, exist_ok=True)
+        with open(manifest + '.tmp', 'w') as file:
+            json.dump(limits, file)
+        os.replace(manifest + '.tmp', manifest)
+
+
+def _to_long(records: list, symbol: str) -> pd.DataFrame:
+    """Melts the statement records of a symbol into (symbol, date, period, field, value) rows."""
+    if len(records) == 0:
+        return pd.DataFrame({'symbol': pd.Series([], dtype='str'), 'date': pd.Series([], dtype='datetime64[ns]'),
+                             'period': pd.Series([], dtype='str'), 'field': pd.Series([], dtype='str'),
+                             'value': pd.Series([], dtype='float64')})
+    df = pd.DataFrame(records)
+    fields = [col for col in df.columns if col not in _META]
+    values = df[fields].apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+    n_records, n_fields = values.shape
+    dates = pd.to_datetime(df['date'], format='ISO8601').to_numpy(dtype='datetime64[ns]')
+    periods = df['period'].to_numpy() if 'period' in df.columns else np.full(n_records, None)
+    long = pd.DataFrame({
+        'symbol': np.full(n_records * n_fields, symbol),
+        'date': np.repeat(dates, n_fields),
+        'period': np.repeat(periods, n_fields),
+        'field': np.tile([to_snake_case(field) for field in fields], n_records),
+        'value': values.ravel(),
+    })
+    return long[~np.isnan(long['value'].to_numpy())]
+
+
+def _load_unit(unit: Tuple[str, str], path: str, period: str, limit: int) -> int:
+    statement, symbol = unit
+    url = f"{base_url_v3}{STATEMENTS[statement]}/{symbol}?period={period}&limit={limit}&apikey={api_key}"
+    json_data = get_json(url)
+    if not isinstance(json_data, list):
+        # error payloads like {'Error Message': ...} come with status 200, the pair must not be stored as empty
+        raise ValueError(f"Unexpected response for {statement} of {symbol}: {json_data}")
+    df = _to_long(json_data, symbol)
+    file = _file(path, period, statement, symbol)
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+    # written under a hidden name first, readers of the dataset ignore it and a crash never leaves a partial file
+    temporary = os.path.join(os.path.dirname(file), f".{symbol}.parquet.tmp")
+    df.to_parquet(temporary, engine='pyarrow', index=False)
+    os.replace(temporary, file)
+    return len(df)
+
+
+def load(symbols: Iterable[str], path: str, statements: Iterable[str] = tuple(STATEMENTS), period: str = 'quarter',
+         limit: int = 120, max_workers: int = 16) -> dict:
+    """
+    Parameters
+    ----------
+    symbols: (Iterable) ticker symbols of the universe
+    path: (str) directory of the store
+    statements: (Iterable) keys of STATEMENTS to load
+    period: (str) 'quarter' or 'annual'
+    limit: (int) maximum number of periods per symbol, must be the same for all loads of a period into a store
+    max_workers: (int) maximum number of concurrent requests, see fmpy.bulk.map
+
+    Returns
+    -------
+    errors: (dict) (statement, symbol) -> raised exception for all failed pairs, which are retried by the next load
+    """
+    _import_pyarrow()
+    statements = list(statements)
+    for statement in statements:
+        if statement not in STATEMENTS:
+            raise ValueError(f"Invalid statement {statement}. Valid statements are {', '.join(STATEMENTS)}")
+    if period not in ('quarter', 'annual'):
+        raise ValueError(f"Invalid period {period}. Valid periods are 'quarter', 'annual'")
+    _check_limit(path, period, limit)
+    symbols = list(dict.fromkeys(symbols))
+    units = [(statement, symbol) for statement in statements for symbol in symbols
+             if not os.path.isfile(_file(path, period, statement, symbol))]
+    skipped = len(symbols) * len(statements) - len(units)
+    start = time.time()
+    results, errors = bulk.map(_load_unit, units, path, period, limit, max_workers=max_workers)
+    print(f"Loaded {len(results)} statements with {sum(results.values())} values in {time.time() - start:.0f}s, "
+          f"skipped {skipped} already stored, {len(errors)} failed")
+    return errors
+
+
+def read(path: str, statements: Iterable[str] = None, symbols: Iterable[str] = None,
+         period: str = 'quarter') -> pd.DataFrame:
+    """Reads the long-format store, the statements of one period and optionally only some types and symbols."""
+    _import_pyarrow()
+    filters = [('frequency', '=', period)]
+    if statements is not None:
+        filters.append(('statement', 'in', list(statements)))
+    if symbols is not None:
+        filters.append(('symbol', 'in', list(symbols)))
+    df = pd.read_parquet(path, engine='pyarrow', filters=filters)
+    df['statement'] = df['statement'].astype(str).astype('category')
+    return df[['statement'] + _COLUMNS]
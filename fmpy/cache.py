@@ -0,0 +1,240 @@
+import os
+import time
+import zlib
+import sqlite3
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module provides the persistent response cache of the shared request path.
+Responses are stored zlib compressed in a SQLite database, keyed by the canonical URL without the API key.
+Every endpoint has its own time to live, e.g. a day for financial statements and a few seconds for quotes,
+and the least recently used entries are evicted once the database exceeds its maximum size.
+"""
+
+__all__ = [
+    'ResponseCache',
+    'DEFAULT_TTLS',
+    'canonical_url',
+    'bypass',
+]
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Time to live in seconds by endpoint path prefix, the longest matching prefix wins. 0 disables caching.
+DEFAULT_TTLS = {
+    # real-time quotes
+    'quote-short': 5,
+    'quote': 5,
+    'quotes': 5,
+    'otc/real-time-price': 5,
+    'fx': 5,
+    'stock-price-change': 5,
+    'stock_market': MINUTE,
+    'is-the-market-open': MINUTE,
+    'sector-performance': MINUTE,
+    'historical-chart': MINUTE,
+    'technical_indicator': MINUTE,
+    # news and feeds
+    'stock_news': 5 * MINUTE,
+    'general_news': 5 * MINUTE,
+    'crypto_news': 5 * MINUTE,
+    'forex_news': 5 * MINUTE,
+    'press-releases': 5 * MINUTE,
+    'fmp/articles': 5 * MINUTE,
+    'rss_feed': 5 * MINUTE,
+    'rss_feed_8k': 5 * MINUTE,
+    'stock-news-sentiments-rss-feed': 5 * MINUTE,
+    'insider-trading-rss-feed': 5 * MINUTE,
+    'senate-trading-rss-feed': 5 * MINUTE,
+    'senate-disclosure-rss-feed': 5 * MINUTE,
+    'price-target-rss-feed': 5 * MINUTE,
+    'upgrades-downgrades-rss-feed': 5 * MINUTE,
+    'mergers-acquisitions-rss-feed': 5 * MINUTE,
+    'fundraising-rss-feed': 5 * MINUTE,
+    'crowdfunding-offerings-rss-feed': 5 * MINUTE,
+    # end of day prices
+    'historical-price-full': HOUR,
+    # fundamentals, change at most quarterly
+    'income-statement': DAY,
+    'balance-sheet-statement': DAY,
+    'cash-flow-statement': DAY,
+    'income-statement-growth': DAY,
+    'balance-sheet-statement-growth': DAY,
+    'cash-flow-statement-growth': DAY,
+    'financial-growth': DAY,
+    'financial-statement-symbol-lists': DAY,
+    'financial-reports-dates': DAY,
+    'financial-reports-json': DAY,
+    'key-metrics': DAY,
+    'key-metrics-ttm': HOUR,
+    'ratios': DAY,
+    'ratios-ttm': HOUR,
+    'enterprise-values': DAY,
+    'revenue-product-segmentation': DAY,
+    'revenue-geographic-segmentation': DAY,
+    'earning_call_transcript': DAY,
+    'batch_earning_call_transcript': DAY,
+    'owner_earnings': DAY,
+    'historical/employee_count': DAY,
+    # reference data
+    'profile': DAY,
+    'key-executives': DAY,
+    'company-core-information': DAY,
+    'stock/list': DAY,
+    'etf/list': DAY,
+    'available-traded/list': DAY,
+    'symbol': DAY,
+    'cik': DAY,
+    'cik_list': DAY,
+    'cik-search': DAY,
+    'cusip': DAY,
+    'mapper-cik-company': DAY,
+    'mapper-cik-name': DAY,
+    'standard_industrial_classification': DAY,
+    'standard_industrial_classification_list': DAY,
+    'get-all-countries': DAY,
+    'insider-trading-transaction-type': DAY,
+}
+
+_bypass = contextvars.ContextVar('fmpy_cache_bypass', default=False)
+
+
+@contextmanager
+def bypass():
+    """
+    Skips cache lookups for all requests inside the block, e.g.
+
+        >>> with bypass():
+        ...     df = get_balance_sheet_statement('AAPL')
+
+    The fresh responses are still written to the cache.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def is_bypassed() -> bool:
+    return _bypass.get()
+
+
+def canonical_url(url: str) -> str:
+    """Returns the URL with sorted query parameters and without the API key."""
+    parts = urlsplit(url)
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key != 'apikey')
+    path = '/'.join(segment for segment in parts.path.split('/') if segment)
+    return f"{parts.netloc}/{path}?{urlencode(query)}"
+
+
+class ResponseCache:
+
+    def __init__(self, path: str, max_size: int = 512 * 2 ** 20, ttls: dict = None, default_ttl: float = 15 * MINUTE):
+        """
+        Parameters
+        ----------
+        path: (str) file path of the SQLite database, created if it doesn't exist
+        max_size: (int) maximum size of the stored compressed responses in bytes
+        ttls: (dict) endpoint path prefix -> time to live in seconds, updates DEFAULT_TTLS
+        default_ttl: (float) time to live of endpoints without a matching prefix
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                               "key TEXT PRIMARY KEY, content BLOB, size INTEGER, created REAL, accessed REAL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def ttl(self, url: str) -> float:
+        path = urlsplit(url).path
+        for version in ('/api/v3/', '/api/v4/'):
+            if version in path:
+                path = path.split(version, 1)[1]
+                break
+        path = path.strip('/')
+        # longest matching prefix on path segment boundaries
+        while path:
+            if path in self.ttls:
+                return self.ttls[path]
+            path = path.rsplit('/', 1)[0] if '/' in path else ''
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[bytes]:
+        ttl = self.ttl(url)
+        if ttl <= 0:
+            return None
+        key = canonical_url(url)
+        now = time.time()
+        with self._connection as connection:
+            row = connection.execute("SELECT content, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            content, created = row
+            if created + ttl < now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return zlib.decompress(content)
+
+    def set(self, url: str, content: bytes):
+        if self.ttl(url) <= 0:
+            return
+        compressed = zlib.compress(content)
+        now = time.time()
+        with self._connection as connection:
+            connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                               (canonical_url(url), compressed, len(compressed), now, now))
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used entries until the cache fits into 90% of max_size."""
+        with self._connection as connection:
+            size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if size <= self.max_size:
+                return
+            target = size - int(self.max_size * 0.9)
+            freed = 0
+            keys = []
+            for key, entry_size in connection.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                keys.append((key,))
+                freed += entry_size
+                if freed >= target:
+                    break
+            connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def clear(self):
+        with self._connection as connection:
+            connection.execute("DELETE FROM responses")
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __repr__(self):
+        return f"ResponseCache(path={self.path!r}, max_size={self.max_size})"
@@ -0,0 +1,275 @@
+import json
+import time
+import random
+import threading
+import contextvars
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from . import config
+from .utils import APIRequestError
+from .rate_limit import TokenBucket
+from .cache import ResponseCache, is_bypassed
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module is the shared transport layer of the SDK. All endpoint functions send their requests through
+a single keep-alive requests.Session, so batch runs reuse warm connections instead of paying a new
+TCP/TLS handshake per call.
+"""
+
+__all__ = [
+    'configure',
+    'get_session',
+    'get_json',
+    'get_rate_limiter',
+    'get_cache',
+    'set_json_backend',
+    'loads',
+    'retry_delay',
+    'close',
+]
+
+# Transient status codes worth retrying, all endpoints are idempotent GET requests
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_DEFAULTS = {
+    'pool_connections': 10,
+    'pool_maxsize': 32,
+    'timeout': None,
+    'max_retries': 3,
+    'backoff_factor': 0.5,
+    'max_backoff': 30,
+}
+
+# Filled from fmpy.config on the first request, so that importing the SDK doesn't read any files
+_settings = {}
+_rate_limiter = None
+_cache = None
+_initialized = False
+_init_lock = threading.Lock()
+
+_session = None
+_lock = threading.Lock()
+# None until a backend is configured, by set_json_backend or from fmpy.config on first use
+_loads = None
+
+# Optional callable url -> json that replaces the HTTP round-trip for the current context.
+# fmpy.aio uses it to run the synchronous endpoint functions on top of an async client.
+_transport = contextvars.ContextVar('fmpy_transport', default=None)
+
+
+def _init():
+    global _rate_limiter, _cache, _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        for key, default in _DEFAULTS.items():
+            _settings.setdefault(key, config.get(key, default))
+        if config.get('calls_per_minute'):
+            _rate_limiter = TokenBucket(config.get('calls_per_minute'), config.get('burst', 10))
+        if config.get('cache_path'):
+            _cache = ResponseCache(config.get('cache_path'), config.get('cache_max_size', 512 * 2 ** 20),
+                                   config.get('cache_ttls'))
+        if _loads is None:
+            set_json_backend(config.get('json_backend', 'auto'))
+        _initialized = True
+
+
+def configure(pool_connections: int = None, pool_maxsize: int = None, timeout: float = None,
+              calls_per_minute: float = None, burst: int = None, max_retries: int = None,
+              backoff_factor: float = None, max_backoff: float = None,
+              cache_path: str = None, cache_max_size: int = None, cache_ttls: dict = None):
+    """
+    Parameters
+    ----------
+    pool_connections: (int) number of host pools to cache
+    pool_maxsize: (int) maximum number of kept-alive connections per host, should be at least the
+                  number of threads issuing requests concurrently
+    timeout: (float) seconds to wait for the server before giving up, None waits forever
+    calls_per_minute: (float) rate limit of your FMP plan, all requests of the process are paced to it.
+                      Pass 0 to disable rate limiting
+    burst: (int) number of requests that may be sent back-to-back after an idle period
+    max_retries: (int) number of retries of a request after a connection error or a transient
+                 status code (429, 500, 502, 503, 504). Pass 0 to disable retries
+    backoff_factor: (float) base of the exponential backoff in seconds, the n-th retry waits
+                    a random time up to backoff_factor * 2 ** (n - 1) seconds
+    max_backoff: (float) upper bound of the backoff in seconds
+    cache_path: (str) file path of the SQLite response cache. Pass an empty string to disable caching
+    cache_max_size: (int) maximum size of the response cache in bytes
+    cache_ttls: (dict) endpoint path prefix -> time to live in seconds, overrides fmpy.cache.DEFAULT_TTLS
+
+    The current session is closed and rebuilt with the new settings on the next request.
+    """
+    global _rate_limiter, _cache
+    _init()
+    if calls_per_minute is not None or burst is not None:
+        if calls_per_minute is None:
+            calls_per_minute = _rate_limiter.calls_per_minute if _rate_limiter is not None else 0
+        if burst is None:
+            burst = _rate_limiter.burst if _rate_limiter is not None else 10
+        _rate_limiter = TokenBucket(calls_per_minute, burst) if calls_per_minute else None
+    if pool_connections is not None:
+        _settings['pool_connections'] = pool_connections
+    if pool_maxsize is not None:
+        _settings['pool_maxsize'] = pool_maxsize
+    if timeout is not None:
+        _settings['timeout'] = timeout
+    if max_retries is not None:
+        _settings['max_retries'] = max_retries
+    if backoff_factor is not None:
+        _settings['backoff_factor'] = backoff_factor
+    if max_backoff is not None:
+        _settings['max_backoff'] = max_backoff
+    if cache_path is not None or cache_max_size is not None or cache_ttls is not None:
+        if cache_path is None:
+            cache_path = _cache.path if _cache is not None else ''
+        if cache_max_size is None:
+            cache_max_size = _cache.max_size if _cache is not None else 512 * 2 ** 20
+        if cache_ttls is None and _cache is not None:
+            cache_ttls = _cache.ttls
+        _cache = ResponseCache(cache_path, cache_max_size, cache_ttls) if cache_path else None
+    close()
+
+
+def set_json_backend(backend='auto'):
+    """
+    Parameters
+    ----------
+    backend: 'auto' uses orjson if it is installed and the standard library json otherwise,
+             'orjson' or 'json' select the backend explicitly. A callable bytes -> object can be
+             passed to plug in any other decoder
+    """
+    global _loads
+    if callable(backend):
+        _loads = backend
+        return
+    if backend not in ('auto', 'orjson', 'json'):
+        raise ValueError(f"Invalid json backend {backend}. Valid backends are 'auto', 'orjson', 'json'")
+    if backend in ('auto', 'orjson'):
+        try:
+            import orjson
+        except ImportError:
+            if backend == 'orjson':
+                raise
+        else:
+            def _orjson_loads(content):
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # orjson is stricter than the standard library, e.g. it rejects NaN literals
+                    return json.loads(content)
+
+            _loads = _orjson_loads
+            return
+    _loads = json.loads
+
+
+def loads(content: bytes):
+    """Decodes a JSON response body straight from its bytes with the configured backend."""
+    if _loads is None:
+        _init()
+    return _loads(content)
+
+
+def _is_error_body(content: bytes) -> bool:
+    """FMP answers errors like {"Error Message": "Limit Reach"} with status 200, they must not be cached."""
+    if len(content) > 4096 or b'Error Message' not in content:
+        return False
+    try:
+        json_data = loads(content)
+    except ValueError:
+        return False
+    return isinstance(json_data, dict) and 'Error Message' in json_data
+
+
+def get_session() -> 'requests.Session':
+    global _session
+    if _session is None:
+        _init()
+        import requests
+        from requests.adapters import HTTPAdapter
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=_settings['pool_connections'],
+                                      pool_maxsize=_settings['pool_maxsize'])
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def get_rate_limiter():
+    _init()
+    return _rate_limiter
+
+
+def get_cache():
+    _init()
+    return _cache
+
+
+def close():
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def retry_delay(attempt: int, retry_after: str = None) -> float:
+    """
+    Returns the seconds to wait before the next attempt. A Retry-After header (seconds or HTTP date)
+    sent by the server is honored, otherwise a full-jitter exponential backoff is used.
+    """
+    if retry_after is not None:
+        try:
+            return max(0., float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0., (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    _init()
+    backoff = min(_settings['max_backoff'], _settings['backoff_factor'] * 2 ** (attempt - 1))
+    return random.uniform(0, backoff)
+
+
+def get_json(url: str):
+    transport = _transport.get()
+    if transport is not None:
+        return transport(url)
+    _init()
+    cache = _cache
+    if cache is not None and not is_bypassed():
+        content = cache.get(url)
+        if content is not None:
+            return loads(content)
+    import requests
+    attempt = 0
+    while True:
+        attempt += 1
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
+        try:
+            response = get_session().get(url, timeout=_settings['timeout'])
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt > _settings['max_retries']:
+                raise
+            time.sleep(retry_delay(attempt))
+            continue
+        if response.status_code == 200:
+            if cache is not None and not _is_error_body(response.content):
+                cache.set(url, response.content)
+            return loads(response.content)
+        if response.status_code in RETRY_STATUS_CODES and attempt <= _settings['max_retries']:
+            time.sleep(retry_delay(attempt, response.headers.get('Retry-After')))
+            continue
+        raise APIRequestError(response.status_code, attempts=attempt, body=response.text)
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 from pandas import Series, DataFrame
 from types import SimpleNamespace
 from typing import Union, List, Any
@@ -27,10 +27,7 @@ __all__ = ['get_company_profile',
 
 def get_company_profile(symbol: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v3}profile/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else {'data': 'no_data'}
     if as_pandas:
         return Series(data)
@@ -39,10 +36,7 @@ def get_company_profile(symbol: str, as_pandas: bool = True) -> Union[Series, Si
 
 def get_key_executives(symbol: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v3}key-executives/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else {'data': 'no_data'}
     if as_pandas:
         return Series(data)
@@ -53,10 +47,7 @@ def get_market_capitalization(symbol: str, historical: bool = False,
                               as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any, float]:
     local_base = 'market-capitalization' if not historical else 'historical-market-capitalization'
     url = f"{base_url_v3}{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0] if len(json_data) > 0 else {'marketCap': 'no_data'}
     if historical and as_pandas:
         return process_dataframe(json_data, *args, **kwargs)
@@ -69,29 +60,20 @@ def get_market_capitalization(symbol: str, historical: bool = False,
 def get_company_outlook(symbol: str):
     warn("This function is still in development and may not work as expected.")
     url = f"{base_url_v4}company-outlook?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return SimpleNamespace(**json_data)
 
 
 def get_stock_peers(symbol: str) -> List[str]:
     url = f"{base_url_v4}stock_peers?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else {'peer_list': 'no_data'}
     return data['peers_list']
 
 
 def get_nyse_holidays_and_trading_hours(as_pandas=True, *args, **kwargs):
     url = f"{base_url_v3}is-the-market-open?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -99,10 +81,7 @@ def get_delisted_companies(page: Union[int, str] = 0,
                            as_pandas: bool = True,
                            *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}delisted-companies?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -112,19 +91,13 @@ def get_delisted_companies(page: Union[int, str] = 0,
 def get_symbol_change(as_pandas: bool = True,
                       *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v4}symbol_change?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_company_core_information(symbol: str, as_pandas: bool = True) -> Union[Series, Any]:
     url = f"{base_url_v4}company-core-information?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else {'data': 'no_data'}
     if as_pandas:
         return Series(data)
@@ -0,0 +1,99 @@
+import os
+import json
+import threading
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module resolves the configuration of the SDK lazily, on the first request instead of at import time.
+Values are looked up in this order:
+    1. options set at runtime via update(), e.g. fmpy.config.update(api_key='<your api key>')
+    2. the environment variables FMP_API_KEY and FMPY_OUTPUT_PATH
+    3. the config.json file, searched in the paths below or at the path in the environment variable FMPY_CONFIG
+"""
+
+__all__ = [
+    'get',
+    'update',
+    'reload',
+    'api_key',
+]
+
+paths = ["../config.json", "./config.json"]
+
+_environment = {
+    'api_key': 'FMP_API_KEY',
+    'output_path': 'FMPY_OUTPUT_PATH',
+}
+
+_overrides = {}
+_data = None
+_lock = threading.Lock()
+
+
+def _load() -> dict:
+    global _data
+    if _data is None:
+        with _lock:
+            if _data is None:
+                data = {}
+                candidates = [os.environ['FMPY_CONFIG']] if 'FMPY_CONFIG' in os.environ else paths
+                for path in candidates:
+                    if os.path.isfile(path):
+                        with open(path) as config:
+                            data = json.load(config)
+                        break
+                for key, variable in _environment.items():
+                    if os.environ.get(variable):
+                        data[key] = os.environ[variable]
+                _data = data
+    return _data
+
+
+def get(key: str, default=None):
+    if key in _overrides:
+        return _overrides[key]
+    return _load().get(key, default)
+
+
+def update(**options):
+    """
+    Sets configuration values at runtime, e.g. update(api_key='<your api key>', output_path='./data').
+    Transport options like calls_per_minute or cache_path only take effect if set before the first request,
+    use fmpy.client.configure() to change them afterwards.
+    """
+    _overrides.update(options)
+
+
+def reload():
+    """Forgets the loaded config.json and environment variables, they are read again on the next lookup."""
+    global _data
+    with _lock:
+        _data = None
+
+
+def get_api_key() -> str:
+    key = get('api_key')
+    if key is None:
+        raise FileNotFoundError("Could not find an API key. Set the environment variable FMP_API_KEY, "
+                                "call fmpy.config.update(api_key=...) or create a config.json in any of the paths "
+                                f"{paths}")
+    return key
+
+
+class _LazyApiKey:
+    """Stands in for the API key string in the URL f-strings and resolves it when the URL is built."""
+
+    def __str__(self):
+        return str(get_api_key())
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __repr__(self):
+        return "<lazy api_key>"
+
+
+api_key = _LazyApiKey()
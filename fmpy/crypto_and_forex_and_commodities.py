@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
 from types import SimpleNamespace
 
@@ -32,10 +32,7 @@ __all__ = [
 
 def get_available_crypto_symbols(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}symbol/available-cryptocurrencies?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -44,13 +41,10 @@ def get_available_crypto_symbols(as_pandas: bool = True, *args, **kwargs):
 
 def get_all_real_time_crypto_prices(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/crypto?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
@@ -59,10 +53,7 @@ def get_real_time_crypto_price(symbol: Union[str, Iterable],
     if not isinstance(symbol, str):
         symbol = ','.join(list(symbol))
     url = f"{base_url_v3}quote/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if count_string_chars(symbol, ',') > 0:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -79,20 +70,13 @@ def get_historical_crypto_prices(symbol: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_currency_exchange_rates(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}fx?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'ticker')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -101,10 +85,7 @@ def get_currency_exchange_rates(as_pandas: bool = True, *args, **kwargs):
 
 def get_currency_exchange_rate_single(symbol: str, as_pandas: bool = True):
     url = f"{base_url_v3}fx/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0])
     if as_pandas:
         return pd.Series(data)
@@ -115,10 +96,7 @@ def get_currency_real_time_price(symbol: str, as_pandas: bool = True, *args, **k
     if not isinstance(symbol, str):
         symbol = ','.join(list(symbol))
     url = f"{base_url_v3}quote/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if count_string_chars(symbol, ',') > 0:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, *args, **kwargs)
@@ -135,23 +113,16 @@ def get_historical_forex_prices(symbol: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
-        return process_dataframe(json_data, *args, **kwargs) if interval is not None else process_dataframe(
-            json_data['historical'], *args, **kwargs)
+        return process_dataframe(json_data, schema_='historical_chart', *args, **kwargs) if interval is not None \
+            else process_dataframe(json_data['historical'], schema_='historical_price', *args, **kwargs)
     return json_data
 
 
 def get_available_commodities_symbols(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}symbol/available-commodities?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symobl')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -160,13 +131,10 @@ def get_available_commodities_symbols(as_pandas: bool = True, *args, **kwargs):
 
 def get_all_real_time_commodity_prices(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/commodity?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
@@ -175,10 +143,7 @@ def get_real_time_commodity_price(symbol: Union[str, Iterable],
     if not isinstance(symbol, str):
         symbol = ','.join(list(symbol))
     url = f"{base_url_v3}quote/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if count_string_chars(symbol, ',') > 0:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -195,12 +160,8 @@ def get_historical_commodity_prices(symbol: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
-        return process_dataframe(json_data, *args, **kwargs) if interval is not None else process_dataframe(
-            json_data['historical'], *args, **kwargs)
+        return process_dataframe(json_data, schema_='historical_chart', *args, **kwargs) if interval is not None \
+            else process_dataframe(json_data['historical'], schema_='historical_price', *args, **kwargs)
     return json_data
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 import datetime
 
 from pandas import DataFrame, Series
@@ -21,10 +21,7 @@ __all__ = ['get_market_risk_premium',
 
 def get_market_risk_premium(as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v4}market_risk_premium?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'country')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -35,10 +32,7 @@ def get_treasury_rates(from_: Union[str, datetime.datetime] = '2008-01-01',
                        to_: Union[str, datetime.datetime] = str(datetime.date.today()),
                        as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v4}treasury?from={from_}&to={to_}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -60,10 +54,7 @@ def get_economic_indicator(name: str, from_: Union[str, datetime.datetime] = '20
     Historical GDP data for specified period of time
     """
     url = f"{base_url_v4}economic?name={name}&from={from_}&to={to_}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         df = process_dataframe(json_data, *args, **kwargs)
         return Series(df.value.values, index=df.index, name=name)
@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
 
 __author__ = 'Lukas Schröder'
@@ -18,10 +18,7 @@ __all__ = [
 
 def get_esg_score(symbol, as_pandas=True, *args, **kwargs):
     url = f"{base_url_v4}esg-environmental-social-governance-data?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         df = pd.DataFrame(json_data)
         df = convert_columns_to_snake_case(df)
@@ -35,10 +32,7 @@ def get_esg_score(symbol, as_pandas=True, *args, **kwargs):
 def get_company_esg_risk_ratings(symbol, as_pandas=True, *args, **kwargs):
     local_base = 'esg-environmental-social-governance-data-ratings'
     url = f"{base_url_v4}{local_base}?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         df = pd.DataFrame(json_data)
         df.index = df.year
@@ -52,10 +46,7 @@ def get_company_esg_risk_ratings(symbol, as_pandas=True, *args, **kwargs):
 def get_esg_benchmarking_by_sector_and_year(year, as_pandas=True, *args, **kwargs):
     local_base = 'esg-environmental-social-governance-sector-benchmark'
     url = f"{base_url_v4}{local_base}?year={year}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         df = pd.DataFrame(json_data)
         df.index = df.year
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 import pandas as pd
 from types import SimpleNamespace
 from typing import Iterable, Union
@@ -21,10 +21,7 @@ __all__ = [
 
 def get_available_euronext_symbols(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}symbol/available-euronext?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -33,13 +30,10 @@ def get_available_euronext_symbols(as_pandas: bool = True, *args, **kwargs):
 
 def get_all_real_time_euronext_prices(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/euronext?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
@@ -48,10 +42,7 @@ def get_real_time_edf_price(symbol: Union[str, Iterable] = 'EDF.PA',
     if not isinstance(symbol, str):
         symbol = ','.join(list(symbol))
     url = f"{base_url_v3}quote/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if count_string_chars(symbol, ',') > 0:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -68,11 +59,8 @@ def get_historical_euronext_prices(symbol: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
-        return process_dataframe(json_data, *args, **kwargs) if interval is not None else process_dataframe(
-            json_data['historical'], *args, **kwargs)
+        return process_dataframe(json_data, schema_='historical_chart', *args, **kwargs) if interval is not None \
+            else process_dataframe(json_data['historical'], schema_='historical_price', *args, **kwargs)
     return json_data
@@ -1,7 +1,7 @@
 # Helper functions and API Key for the user
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
 
 from pandas import DataFrame, Series
@@ -38,10 +38,7 @@ __all__ = [
 
 def get_etf_expense_ratio(symbol: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v4}etf-info?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else json_data
     if as_pandas:
         return Series(data)
@@ -50,10 +47,7 @@ def get_etf_expense_ratio(symbol: str, as_pandas: bool = True) -> Union[Series,
 
 def get_institutional_holders(symbol: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}institutional-holder/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'holder')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -62,10 +56,7 @@ def get_institutional_holders(symbol: str, as_pandas: bool = True, *args, **kwar
 
 def get_mutual_fund_holders(symbol: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}mutual-fund-holder/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'holder')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -74,10 +65,7 @@ def get_mutual_fund_holders(symbol: str, as_pandas: bool = True, *args, **kwargs
 
 def get_etf_sector_weightings(symbol: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}etf-sector-weightings/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'sector')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -86,10 +74,7 @@ def get_etf_sector_weightings(symbol: str, as_pandas: bool = True, *args, **kwar
 
 def get_etf_country_weightings(symbol: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}etf-country-weightings/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'country')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -98,10 +83,7 @@ def get_etf_country_weightings(symbol: str, as_pandas: bool = True, *args, **kwa
 
 def get_etf_stock_exposure(symbol: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}etf-stock-exposure/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'etf_symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -110,34 +92,27 @@ def get_etf_stock_exposure(symbol: str, as_pandas: bool = True, *args, **kwargs)
 
 def get_13F_list(as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}cik_list?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'cik')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
     return json_data
 
 
+@memoize()
 def get_cik_by_name(name: str, as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}cik-search/{name}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'cik')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
     return json_data
 
 
+@memoize()
 def get_company_name_by_cik(cik: str):
     url = f"{base_url_v3}cik/{cik}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     if len(data) == 0:
         return None
@@ -147,28 +122,20 @@ def get_company_name_by_cik(cik: str):
 def get_form_13F(cik: str, date: str = str(date.today()),
                  as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}form-thirteen/{cik}?date={date}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
-    return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
+    json_data = get_json(url)
+    return process_dataframe(json_data, schema_='form_13F', *args, **kwargs) if as_pandas else json_data
 
 
 def get_filing_dates_by_cik(cik: str) -> Any:
     url = f"{base_url_v3}form-thirteen-date/{cik}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return json_data
 
 
+@memoize()
 def get_cusip_mapper(cik: str) -> Any:
     url = f"{base_url_v3}cusip/{cik}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return json_data
 
 
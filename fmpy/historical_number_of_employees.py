@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 from pandas import DataFrame
 from typing import Any, Union
 
@@ -20,8 +20,5 @@ __all__ = [
 def get_historical_number_of_employees(symbol: str, as_pandas: bool = True,
                                        *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v4}historical/employee_count?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
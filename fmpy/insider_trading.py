@@ -1,9 +1,7 @@
 from .utils import *
-import requests
+from .client import get_json
 from typing import Union
 
-url_api = f"apikey={api_key}"
-
 __author__ = 'Lukas Schröder'
 __date__ = '2023-05-20'
 __version__ = '0.1.0'
@@ -24,12 +22,10 @@ __all__ = [
 ]
 
 
+@memoize()
 def get_transaction_types_list() -> list:
     url = f"{base_url_v4}insider-trading-transaction-type?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return json_data
 
 
@@ -49,13 +45,11 @@ def get_insider_trading(symbol: str = None, transaction_type: str = None,
     else:
         raise AttributeError("You are required to either pass a symbol,"
                              " transaction type, reporting cik or company cik")
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
-    return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
+    json_data = get_json(url)
+    return process_dataframe(json_data, schema_='insider_trading', *args, **kwargs) if as_pandas else json_data
 
 
+@memoize()
 def get_cik_mapper(symbol: str = None, name: str = None,
                    page: Union[int, str] = 2, as_pandas: bool = True,
                    *args, **kwargs):
@@ -65,10 +59,7 @@ def get_cik_mapper(symbol: str = None, name: str = None,
         url = f"{base_url_v4}mapper-cik-name?page={page}&apikey={api_key}"
         if name is not None:
             url += f"&name={name}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if symbol is not None:
         data = json_data[0]
         return data['companyCik']
@@ -78,20 +69,14 @@ def get_cik_mapper(symbol: str = None, name: str = None,
 def get_insider_roaster(symbol: str, as_pandas: bool = True,
                         *args, **kwargs):
     url = f"{base_url_v4}insider-roaster?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_insider_roaster_statistics(symbol: str, as_pandas: bool = True,
                                    *args, **kwargs):
     url = f"{base_url_v4}insider-roaster-statistic?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     index = kwargs.pop('index_', 'year')
     return process_dataframe(json_data, index_=index, *args, **kwargs) if as_pandas else json_data
 
@@ -99,19 +84,13 @@ def get_insider_roaster_statistics(symbol: str, as_pandas: bool = True,
 def get_insider_trading_rss_feed(page: Union[int, str] = 0, as_pandas: bool = True,
                                  *args, **kwargs):
     url = f"{base_url_v4}insider-trading-rss-feed?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     index = kwargs.pop('index_', 'symbol')
-    return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
+    return process_dataframe(json_data, schema_='insider_trading', *args, **kwargs) if as_pandas else json_data
 
 
 def get_fail_to_deliver(symbol: str, page: Union[int, str] = 0,
                         as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}fail_to_deliver?symbol={symbol}&page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
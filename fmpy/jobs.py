@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import zlib
+import pickle
+import sqlite3
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Iterator, Tuple
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module runs long batch pulls as resumable jobs, e.g.
+
+    >>> from fmpy.jobs import JobRunner
+    >>> from fmpy.fund_holdings import get_form_13F
+    >>> runner = JobRunner('./jobs.db', name='13F-2023-06-30')
+    >>> runner.run(get_form_13F, [(cik, '2023-06-30') for cik in ciks])
+    >>> holdings = runner.results(get_form_13F)
+
+Every unit of work, a function and its arguments, is recorded with its result in a SQLite checkpoint database
+as soon as it completes. After a crash or interruption the same call skips all completed units and
+retries the failed ones. Progress, throughput and ETA are printed while the job runs.
+"""
+
+__all__ = [
+    'JobRunner',
+]
+
+
+def _function_name(func: Callable, args: tuple = (), kwargs: dict = None) -> str:
+    func = getattr(func, '__wrapped__', func)
+    name = f"{func.__module__}.{func.__qualname__}"
+    if args or kwargs:
+        # the arguments passed to run for every unit are part of the identity, e.g. period='quarter'
+        name += _unit_key(args, kwargs or {})
+    return name
+
+
+def _split_unit(unit) -> Tuple[tuple, dict]:
+    # a unit is a tuple of arguments, a dict of keyword arguments or a single argument
+    if isinstance(unit, tuple):
+        return unit, {}
+    if isinstance(unit, dict):
+        return (), unit
+    return (unit,), {}
+
+
+def _unit_key(args: tuple, kwargs: dict) -> str:
+    return json.dumps([list(args), kwargs], sort_keys=True, default=str)
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+class JobRunner:
+
+    def __init__(self, path: str, name: str = 'default', max_workers: int = 8, progress_interval: float = 10.):
+        """
+        Parameters
+        ----------
+        path: (str) file path of the SQLite checkpoint database, created if it doesn't exist
+        name: (str) name of the job, several jobs can share a database
+        max_workers: (int) maximum number of concurrent units
+        progress_interval: (float) seconds between two progress reports, 0 disables them
+        """
+        self.path = path
+        self.name = name
+        self.max_workers = max_workers
+        self.progress_interval = progress_interval
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS units ("
+                               "job TEXT, function TEXT, key TEXT, status TEXT, result BLOB, error TEXT, "
+                               "finished REAL, PRIMARY KEY (job, function, key))")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def _completed(self, connection: sqlite3.Connection, function: str) -> set:
+        rows = connection.execute("SELECT key FROM units WHERE job = ? AND function = ? AND status = 'done'",
+                                  (self.name, function))
+        return {key for key, in rows}
+
+    def run(self, func: Callable, units: Iterable, *args, **kwargs) -> dict:
+        """
+        Calls func for every unit that hasn't been completed in an earlier run.
+
+        Parameters
+        ----------
+        func: (Callable) endpoint function, e.g. get_form_13F or get_earning_call_transcript
+        units: (Iterable) of argument tuples, keyword argument dicts or single arguments, e.g. symbols
+        args, kwargs: passed on to every func call after the arguments of the unit. Units run with other
+                      args and kwargs are separate units, pass the same to results to read them
+
+        Returns
+        -------
+        errors: (dict) unit key -> error message of all units that failed in this run
+        """
+        function = _function_name(func, args, kwargs)
+        connection = self._connect()
+        try:
+            completed = self._completed(connection, function)
+            pending = {}
+            for unit in units:
+                unit_args, unit_kwargs = _split_unit(unit)
+                key = _unit_key(unit_args, unit_kwargs)
+                if key not in completed:
+                    pending[key] = (unit_args, unit_kwargs)
+            total = len(pending)
+            print(f"Job {self.name}: {total} units to run, {len(completed)} already completed")
+
+            errors = {}
+            done = 0
+            start = last_report = time.time()
+            remaining = iter(pending.items())
+            in_flight = {}
+
+            def submit(executor):
+                # only a few units are in flight, so that results are persisted and released one by one
+                for key, (unit_args, unit_kwargs) in remaining:
+                    # each call runs in a copy of the caller's context, see fmpy.bulk.map
+                    future = executor.submit(contextvars.copy_context().run, func, *unit_args, *args,
+                                             **{**unit_kwargs, **kwargs})
+                    in_flight[future] = key
+                    if len(in_flight) >= 2 * self.max_workers:
+                        break
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                submit(executor)
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        key = in_flight.pop(future)
+                        exception = future.exception()
+                        if not isinstance(exception, (Exception, type(None))):
+                            # e.g. KeyboardInterrupt or the pending request of fmpy.aio, they end the whole run
+                            raise exception
+                        # every unit is committed on its own, an interruption loses at most the units in flight
+                        with connection:
+                            if exception is None:
+                                result = zlib.compress(pickle.dumps(future.result(),
+                                                                    protocol=pickle.HIGHEST_PROTOCOL))
+                                connection.execute("INSERT OR REPLACE INTO units VALUES (?, ?, ?, 'done', ?, NULL, ?)",
+                                                   (self.name, function, key, result, time.time()))
+                            else:
+                                errors[key] = repr(exception)
+                                connection.execute("INSERT OR REPLACE INTO units "
+                                                   "VALUES (?, ?, ?, 'failed', NULL, ?, ?)",
+                                                   (self.name, function, key, repr(exception), time.time()))
+                        done += 1
+                    submit(executor)
+                    now = time.time()
+                    if self.progress_interval and (now - last_report >= self.progress_interval or done == total):
+                        last_report = now
+                        self._report(done, total, len(errors), now - start)
+        finally:
+            connection.close()
+        return errors
+
+    def _report(self, done: int, total: int, failed: int, elapsed: float):
+        rate = done / elapsed if elapsed > 0 else 0.
+        eta = (total - done) / rate if rate > 0 else 0.
+        print(f"Job {self.name}: {done}/{total} units ({done / total:.1%}), {failed} failed, "
+              f"{rate:.1f} units/s, elapsed {_format_seconds(elapsed)}, ETA {_format_seconds(eta)}")
+
+    def iter_results(self, func: Callable, *args, **kwargs) -> Iterator[Tuple[tuple, dict, object]]:
+        """
+        Yields (args, kwargs, result) of all completed units of func run with args and kwargs,
+        one unit in memory at a time.
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute("SELECT key, result FROM units WHERE job = ? AND function = ? AND status = 'done'",
+                                      (self.name, _function_name(func, args, kwargs)))
+            for key, result in rows:
+                unit_args, unit_kwargs = json.loads(key)
+                yield tuple(unit_args), unit_kwargs, pickle.loads(zlib.decompress(result))
+        finally:
+            connection.close()
+
+    def results(self, func: Callable, *args, **kwargs) -> dict:
+        """
+        Returns the results of all completed units of func run with args and kwargs, keyed by the single
+        argument of the unit or the tuple of its arguments, e.g. for fmpy.bulk.concat of single symbol units.
+        """
+        results = {}
+        for unit_args, unit_kwargs, result in self.iter_results(func, *args, **kwargs):
+            key = unit_args[0] if len(unit_args) == 1 and not unit_kwargs else (*unit_args, *unit_kwargs.values())
+            results[key] = result
+        return results
+
+    def status(self, func: Callable = None, *args, **kwargs) -> dict:
+        """
+        Returns the number of units per status, of func run with args and kwargs or of the whole job,
+        e.g. {'done': 4980, 'failed': 20}.
+        """
+        connection = self._connect()
+        try:
+            query = "SELECT status, COUNT(*) FROM units WHERE job = ?"
+            parameters = [self.name]
+            if func is not None:
+                query += " AND function = ?"
+                parameters.append(_function_name(func, args, kwargs))
+            return dict(connection.execute(query + " GROUP BY status", parameters).fetchall())
+        finally:
+            connection.close()
+
+    def reset(self, func: Callable = None, *args, **kwargs):
+        """Forgets the completed units, of func run with args and kwargs or of the whole job."""
+        with self._connect() as connection:
+            if func is None:
+                connection.execute("DELETE FROM units WHERE job = ?", (self.name,))
+            else:
+                connection.execute("DELETE FROM units WHERE job = ? AND function = ?",
+                                   (self.name, _function_name(func, args, kwargs)))
+
+    def __repr__(self):
+        return f"JobRunner(path={self.path!r}, name={self.name!r})"
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 
 __author__ = 'Lukas Schröder'
 __date__ = '2023-08-05'
@@ -25,32 +25,23 @@ __all__ = [
 
 def get_all_major_indexes(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/index?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
 def get_real_time_stock_market_index(market_index: str = '%5EGSPC',
                                      as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quote/{market_index}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_list_of_sp500_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}sp500_constituent?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -59,10 +50,7 @@ def get_list_of_sp500_companies(as_pandas: bool = True, *args, **kwargs):
 
 def get_historical_sp500_constituents_list(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}historical/sp500_constituent?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -71,10 +59,7 @@ def get_historical_sp500_constituents_list(as_pandas: bool = True, *args, **kwar
 
 def get_list_of_nasdaq100_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}nasdaq_constituent?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -83,10 +68,7 @@ def get_list_of_nasdaq100_companies(as_pandas: bool = True, *args, **kwargs):
 
 def get_list_of_dow_jones_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}dowjones_constituent?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -95,10 +77,7 @@ def get_list_of_dow_jones_companies(as_pandas: bool = True, *args, **kwargs):
 
 def get_historical_dow_jones_constituents_list(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}historical/dowjones_constituent?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -107,10 +86,7 @@ def get_historical_dow_jones_constituents_list(as_pandas: bool = True, *args, **
 
 def get_available_historical_stock_index_prices(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}symbol/available-indexes?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -124,9 +100,5 @@ def get_historical_stock_index_prices(market_index: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{market_index}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 import datetime as dt
 from typing import Union
 
@@ -27,10 +27,7 @@ def get_sectors_pe_ratio(date: Union[dt.date, str] = None, exchange: str = 'NYSE
     if date is None:
         date = str(dt.date.today())
     url = f"{base_url_v4}sector_price_earning_ratio?date={date}&exchange={exchange}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -39,10 +36,7 @@ def get_industries_pe_ratio(date: Union[dt.date, str] = None, exchange: str = 'N
     if date is None:
         date = str(dt.date.today())
     url = f"{base_url_v4}industry_price_earning_ratio?date={date}&exchange={exchange}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -52,10 +46,7 @@ def get_stock_market_sector_performance(historical: bool = False, as_pandas: boo
     if historical:
         url = f"{base_url_v3}historical-sectors-performance?apikey={api_key}"
     url += f"&limit={limit}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         if not historical:
             index_ = kwargs.pop('index_', 'sector')
@@ -66,10 +57,7 @@ def get_stock_market_sector_performance(historical: bool = False, as_pandas: boo
 
 def get_most_gainer_stock_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}stock_market/gainers?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -77,10 +65,7 @@ def get_most_gainer_stock_companies(as_pandas: bool = True, *args, **kwargs):
 
 def get_most_losers_stock_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}stock_market/losers?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -89,10 +74,7 @@ def get_most_losers_stock_companies(as_pandas: bool = True, *args, **kwargs):
 
 def get_most_active_stock_companies(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}stock_market/actives?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -0,0 +1,130 @@
+import contextvars
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Union
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module streams paginated endpoints page by page, e.g.
+
+    >>> from fmpy.pagination import paginate
+    >>> from fmpy.insider_trading import get_insider_trading
+    >>> for df in paginate(get_insider_trading, symbol='AAPL', until='2015-01-01'):
+    ...     df.to_parquet(...)
+
+While a page is processed, the next pages are already requested in the background.
+Only the pages in flight are held in memory, no matter how far back the iteration goes.
+Works with every endpoint function taking a page argument, e.g. get_delisted_companies, get_sec_rss_feed,
+get_rss_feed_8k_forms, get_stock_news, get_fail_to_deliver or get_price_target_rss_feed.
+"""
+
+__all__ = [
+    'paginate',
+]
+
+
+def _is_empty(chunk) -> bool:
+    if isinstance(chunk, pd.DataFrame):
+        return chunk.empty
+    return not chunk
+
+
+def _dates(chunk, date_key: str = None) -> pd.DatetimeIndex:
+    """Returns the dates of the rows of a page, as index or column of a DataFrame or key of the records."""
+    if isinstance(chunk, pd.DataFrame):
+        if date_key is None and isinstance(chunk.index, pd.DatetimeIndex):
+            return chunk.index
+        if date_key is None:
+            date_cols = [col for col in chunk.columns if 'date' in str(col).lower()]
+            if len(date_cols) == 0:
+                raise AttributeError("Couldn't find a date column, pass date_key")
+            date_key = date_cols[-1]
+        values = chunk.index if chunk.index.name == date_key else chunk[date_key]
+    else:
+        if date_key is None:
+            keys = [key for key in chunk[0] if 'date' in key.lower()]
+            if len(keys) == 0:
+                raise AttributeError("Couldn't find a date key, pass date_key")
+            date_key = 'date' if 'date' in keys else keys[-1]
+        values = [record.get(date_key) for record in chunk]
+    return pd.DatetimeIndex(pd.to_datetime(values, format='ISO8601', errors='coerce'))
+
+
+def _take(chunk, mask):
+    if isinstance(chunk, pd.DataFrame):
+        return chunk[mask]
+    return [record for record, keep in zip(chunk, mask) if keep]
+
+
+def paginate(func: Callable, *args, start: int = 0, max_pages: int = None, prefetch: int = 1,
+             until: str = None, date_key: str = None, stop: Callable = None,
+             **kwargs) -> Iterator[Union[pd.DataFrame, list]]:
+    """
+    Yields the pages of a paginated endpoint function until a page is empty or a stop condition is met.
+
+    Parameters
+    ----------
+    func: (Callable) endpoint function taking a page argument, e.g. get_insider_trading
+    start: (int) first page
+    max_pages: (int) maximum number of pages, None iterates until an empty page
+    prefetch: (int) number of pages requested in the background ahead of the page being processed,
+              0 requests every page only when it is needed
+    until: (str) 'YYYY-MM-DD', the iteration ends at the first page reaching back before this date.
+           Rows older than until are dropped from that page
+    date_key: (str) column or key holding the dates compared with until.
+              Defaults to the date index or the last column containing 'date'
+    stop: (Callable) page -> bool, the iteration ends after the first page for which it returns True
+    args, kwargs: passed on to every func call, e.g. symbol='AAPL' or as_pandas=False to get the raw records
+
+    Yields
+    ------
+    The pages as returned by func, DataFrames or lists of records
+    """
+    until = pd.Timestamp(until) if until is not None else None
+    end = start + max_pages if max_pages is not None else None
+    next_page = start
+
+    def submit(executor, futures, pages):
+        # tops the requests in flight up to pages
+        nonlocal next_page
+        while len(futures) < pages and (end is None or next_page < end):
+            # each page is requested in a copy of the consumer's context, see fmpy.bulk.map
+            futures.append(executor.submit(contextvars.copy_context().run, func, *args, page=next_page, **kwargs))
+            next_page += 1
+
+    executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+    futures = deque()
+    try:
+        # the first page and the pages ahead of it
+        submit(executor, futures, prefetch + 1)
+        while futures:
+            chunk = futures.popleft().result()
+            if _is_empty(chunk):
+                return
+            done = False
+            if until is not None:
+                dates = _dates(chunk, date_key)
+                # rows without a date are kept
+                mask = (dates >= until) | dates.isna()
+                if not mask.all():
+                    chunk = _take(chunk, mask)
+                    done = True
+            if stop is not None and stop(chunk):
+                done = True
+            if done:
+                if not _is_empty(chunk):
+                    yield chunk
+                return
+            # while the page is processed, the prefetch pages after it are in flight
+            yield chunk
+            # the next page is awaited right away, prefetch more are requested behind it
+            submit(executor, futures, prefetch + 1)
+    finally:
+        # pages requested ahead of a stop are discarded, the iteration doesn't wait for them
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
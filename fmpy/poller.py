@@ -0,0 +1,175 @@
+import time
+import random
+import asyncio
+import threading
+import pandas as pd
+from typing import Callable, Iterable
+
+from .cache import bypass
+from .stock_price import get_quote_snapshot
+from .company_information import get_nyse_holidays_and_trading_hours
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module polls the quotes of a watchlist and reports only what changed, e.g.
+
+    >>> from fmpy.poller import QuotePoller
+    >>> poller = QuotePoller(['AAPL', 'MSFT', 'NVDA'], interval=5, callback=print)
+    >>> poller.start()
+    ...
+    >>> poller.stop()
+
+Every tick fetches all symbols with a few batch requests (see get_quote_snapshot) instead of one request
+per symbol and field, diffs the quotes against the previous tick and passes the changed rows to the callbacks
+and queues. While the NYSE is closed the poller slows down to closed_interval.
+It runs in a background thread with start() or as asyncio task with run_async().
+"""
+
+__all__ = [
+    'QuotePoller',
+]
+
+
+def _changed(previous: pd.DataFrame, current: pd.DataFrame, fields: list) -> pd.Index:
+    """Symbols that are new or whose fields differ from the previous snapshot."""
+    if previous is None:
+        return current.index
+    fields = [field for field in fields if field in current.columns]
+    old = previous.reindex(index=current.index, columns=fields)
+    new = current[fields]
+    differs = (new != old) & ~(new.isna() & old.isna())
+    return current.index[differs.any(axis=1).to_numpy() | ~current.index.isin(previous.index)]
+
+
+class QuotePoller:
+
+    def __init__(self, symbols: Iterable[str], interval: float = 5., endpoint: str = 'quote-short',
+                 fields: Iterable[str] = None, callback: Callable = None, queue=None,
+                 jitter: float = 0.1, closed_interval: float = 300., market_check_interval: float = 60.,
+                 max_workers: int = 8):
+        """
+        Parameters
+        ----------
+        symbols: (Iterable) ticker symbols to watch
+        interval: (float) seconds between two ticks while the market is open
+        endpoint: (str) quote endpoint, see get_quote_snapshot
+        fields: (Iterable) quote columns compared between ticks, e.g. ['price', 'volume'], None compares all
+        callback: (Callable) called with a DataFrame of the changed quotes, more can be added with add_callback
+        queue: queue.Queue or asyncio.Queue the DataFrames of changed quotes are put into
+        jitter: (float) random variation of the interval as fraction, spreads the requests of several pollers
+        closed_interval: (float) seconds between two ticks while the NYSE is closed
+        market_check_interval: (float) seconds between two checks of the market hours
+        max_workers: (int) maximum number of concurrent requests per tick
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.interval = interval
+        self.endpoint = endpoint
+        self.fields = list(fields) if fields is not None else None
+        self.jitter = jitter
+        self.closed_interval = closed_interval
+        self.market_check_interval = market_check_interval
+        self.max_workers = max_workers
+        self.callbacks = [callback] if callback is not None else []
+        self.queues = [queue] if queue is not None else []
+        self.snapshot = None
+        self._market_open = True
+        self._market_checked = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_callback(self, callback: Callable):
+        self.callbacks.append(callback)
+
+    def add_queue(self, queue):
+        self.queues.append(queue)
+
+    def market_is_open(self) -> bool:
+        now = time.monotonic()
+        if self._market_checked is None or now - self._market_checked >= self.market_check_interval:
+            self._market_checked = now
+            try:
+                self._market_open = bool(get_nyse_holidays_and_trading_hours(as_pandas=False)
+                                         .get('isTheStockMarketOpen', True))
+            except Exception:
+                # without market hours keep polling at the regular interval
+                self._market_open = True
+        return self._market_open
+
+    def next_interval(self) -> float:
+        interval = self.interval if self.market_is_open() else self.closed_interval
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _diff(self) -> pd.DataFrame:
+        # the response cache keeps quotes for seconds, every tick needs the current ones
+        with bypass():
+            current = get_quote_snapshot(self.symbols, endpoint=self.endpoint, max_workers=self.max_workers)
+        if self.snapshot is not None:
+            # symbols of a failed chunk keep their previous quotes instead of being reported as new next tick
+            missing = self.snapshot.index.difference(current.index)
+            if len(missing) > 0:
+                kept = self.snapshot.loc[missing]
+                current = kept if current.empty else pd.concat([current, kept])
+        fields = self.fields if self.fields is not None else list(current.columns)
+        changes = current.loc[_changed(self.snapshot, current, fields)]
+        self.snapshot = current
+        return changes
+
+    def _dispatch(self, changes: pd.DataFrame):
+        if changes.empty:
+            return
+        for callback in self.callbacks:
+            callback(changes)
+        for queue in self.queues:
+            queue.put_nowait(changes)
+
+    def poll(self) -> pd.DataFrame:
+        """Fetches the quotes once and returns the changed rows, which are also passed to callbacks and queues."""
+        changes = self._diff()
+        self._dispatch(changes)
+        return changes
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                # a failed tick must not end the polling, the next tick retries
+                print(f"Quote poll failed: {e}")
+            self._stop.wait(self.next_interval())
+
+    def start(self):
+        """Polls in a background thread until stop() is called."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='fmpy-quote-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    async def run_async(self):
+        """
+        Polls until the task is cancelled or stop() is called, e.g. asyncio.create_task(poller.run_async()).
+        The blocking requests of a tick run in a worker thread, callbacks and queues are served
+        from the event loop, so an asyncio.Queue can be used.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                changes = await asyncio.to_thread(self._diff)
+            except Exception as e:
+                print(f"Quote poll failed: {e}")
+            else:
+                self._dispatch(changes)
+            interval = await asyncio.to_thread(self.next_interval)
+            await asyncio.sleep(interval)
+
+    def __repr__(self):
+        return f"QuotePoller(symbols={len(self.symbols)}, interval={self.interval}, endpoint={self.endpoint!r})"
@@ -0,0 +1,137 @@
+import os
+import datetime as dt
+import numpy as np
+import pandas as pd
+from typing import Iterable, Tuple
+
+from . import bulk
+from . import config
+from .stock_price import get_historical_stock_split, _get_historical_chunk
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module keeps a local per-symbol store of daily price histories and syncs it incrementally, e.g.
+
+    >>> from fmpy.price_store import PriceStore
+    >>> store = PriceStore('./prices')
+    >>> df = store.sync('AAPL')
+    >>> results, errors = store.sync_many(['AAPL', 'MSFT', 'NVDA'])
+
+The first sync downloads the full history, every later sync only requests the bars from the last stored date on.
+FMP adjusts the whole history after a split, so a symbol with a split after its last stored date is pulled
+again in full. The same happens if the overlapping bar of the delta differs from the stored one,
+e.g. after a dividend changed the adjusted close.
+"""
+
+__all__ = [
+    'PriceStore',
+]
+
+
+class PriceStore:
+
+    def __init__(self, path: str = None, from_: str = '2008-01-01', serietype: str = 'line'):
+        """
+        Parameters
+        ----------
+        path: (str) directory of the store, defaults to 'prices' in the configured output path
+        from_: (str) first date of a full pull, 'YYYY-MM-DD'
+        serietype: (str) series type as in get_stock_historical_price
+        """
+        if path is None:
+            path = os.path.join(config.get('output_path') or '.', 'prices')
+        self.path = path
+        self.from_ = from_
+        self.serietype = serietype
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, symbol: str) -> str:
+        return os.path.join(self.path, f"{symbol}.pkl")
+
+    def load(self, symbol: str):
+        """Returns the stored history of the symbol in ascending date order, None if it isn't stored yet."""
+        file = self._file(symbol)
+        if not os.path.isfile(file):
+            return None
+        return pd.read_pickle(file)
+
+    def last_date(self, symbol: str):
+        df = self.load(symbol)
+        if df is None or df.empty:
+            return None
+        return df.index[-1]
+
+    def _save(self, symbol: str, df: pd.DataFrame):
+        # write to a temporary file first so that an interrupted sync never leaves a truncated store
+        file = self._file(symbol)
+        df.to_pickle(file + '.tmp')
+        os.replace(file + '.tmp', file)
+
+    def _fetch(self, symbol: str, from_: str) -> pd.DataFrame:
+        df = _get_historical_chunk(symbol, from_, str(dt.date.today()), self.serietype)
+        if df.empty:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='date'))
+        return df.droplevel('symbol').sort_index()
+
+    def _has_split_since(self, symbol: str, date: pd.Timestamp) -> bool:
+        json_data = get_historical_stock_split(symbol, as_pandas=False)
+        splits = json_data.get('historical', []) if isinstance(json_data, dict) else []
+        return any(pd.Timestamp(split['date']) > date for split in splits)
+
+    @staticmethod
+    def _is_consistent(stored: pd.DataFrame, delta: pd.DataFrame, date: pd.Timestamp) -> bool:
+        if date not in delta.index:
+            return True
+        for col in ('adj_close', 'close'):
+            if col in stored.columns and col in delta.columns:
+                return bool(np.isclose(stored.at[date, col], delta.at[date, col], rtol=1e-6, equal_nan=True))
+        return True
+
+    def _fetch_full(self, symbol: str, stored: pd.DataFrame) -> pd.DataFrame:
+        df = self._fetch(symbol, self.from_)
+        if df.empty and stored is not None and not stored.empty:
+            # an empty answer must never replace a stored history
+            raise ValueError(f"Full pull of {symbol} returned no bars, kept the stored history")
+        return df
+
+    def sync(self, symbol: str, full: bool = False) -> pd.DataFrame:
+        """
+        Brings the stored history of the symbol up to date and returns it in ascending date order.
+
+        Parameters
+        ----------
+        symbol: (str) ticker symbol
+        full: (bool) pulls the full history regardless of the stored one
+
+        A full pull that returns no bars raises ValueError instead of overwriting a stored history.
+        """
+        stored = self.load(symbol)
+        if full or stored is None or stored.empty:
+            df = self._fetch_full(symbol, stored)
+        else:
+            last_date = stored.index[-1]
+            if self._has_split_since(symbol, last_date):
+                df = self._fetch_full(symbol, stored)
+            else:
+                # the delta starts at the last stored bar, which is replaced by its final version
+                delta = self._fetch(symbol, str(last_date.date()))
+                if delta.empty:
+                    # no new bars, e.g. on a holiday or if FMP answers with an empty object
+                    return stored
+                if self._is_consistent(stored, delta, last_date):
+                    df = pd.concat([stored[stored.index < delta.index[0]], delta])
+                else:
+                    df = self._fetch_full(symbol, stored)
+        df = df[~df.index.duplicated(keep='last')]
+        self._save(symbol, df)
+        return df
+
+    def sync_many(self, symbols: Iterable[str], full: bool = False, max_workers: int = 8) -> Tuple[dict, dict]:
+        """Syncs the symbols concurrently, returns the results and errors of fmpy.bulk.map."""
+        return bulk.map(self.sync, symbols, full, max_workers=max_workers)
+
+    def __repr__(self):
+        return f"PriceStore(path={self.path!r})"
@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 from pandas import DataFrame, Series
 from types import SimpleNamespace
 from typing import List, Union
@@ -26,19 +26,13 @@ __all__ = [
 def get_price_target(symbol: str, as_pandas: bool = True,
                     *args, **kwargs) -> Union[DataFrame, List[dict]]:
     url = f"{base_url_v4}price-target?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_price_target_summary(symbol: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v4}price-target-summary?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         return Series(json_data[0])
     data = json_data[0]
@@ -47,10 +41,7 @@ def get_price_target_summary(symbol: str, as_pandas: bool = True) -> Union[Serie
 
 def get_price_target_by_analyst_name(name: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v4}price-target-analyst-name?name={name}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     data = convert_dict_keys_to_snake_case(data)
     if as_pandas:
@@ -60,10 +51,7 @@ def get_price_target_by_analyst_name(name: str, as_pandas: bool = True) -> Union
 
 def get_price_target_by_analyst_company(company: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v4}price-target-analyst-company?company={company}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     data = convert_dict_keys_to_snake_case(data)
     if as_pandas:
@@ -73,10 +61,7 @@ def get_price_target_by_analyst_company(company: str, as_pandas: bool = True) ->
 
 def get_price_target_consensus(symbol: str, as_pandas: bool = True) -> Union[Series, SimpleNamespace]:
     url = f"{base_url_v4}price-target-consensus?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     data = convert_dict_keys_to_snake_case(data)
     if as_pandas:
@@ -86,8 +71,5 @@ def get_price_target_consensus(symbol: str, as_pandas: bool = True) -> Union[Ser
 
 def get_price_target_rss_feed(page: Union[str, int] = 0, as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}price-target-rss-feed?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
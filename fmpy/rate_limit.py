@@ -0,0 +1,62 @@
+import time
+import asyncio
+import threading
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module provides the client-side rate limiter used by the shared request path.
+FMP plans allow a fixed number of calls per minute, the token bucket paces all requests of the
+process, across threads and event loops, so that parallel batches run at the plan rate
+instead of running into 429 responses.
+"""
+
+__all__ = [
+    'TokenBucket',
+]
+
+
+class TokenBucket:
+
+    def __init__(self, calls_per_minute: float, burst: int = 10):
+        """
+        Parameters
+        ----------
+        calls_per_minute: (float) sustained request rate, e.g. 300 for the Starter or 750 for the Premium plan
+        burst: (int) number of requests that may be sent back-to-back after an idle period
+        """
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
+        self.calls_per_minute = calls_per_minute
+        self.burst = max(1, int(burst))
+        self._rate = calls_per_minute / 60
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes one token and returns the number of seconds the caller has to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # tokens may become negative, which queues the callers behind each other
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.
+            return -self._tokens / self._rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __repr__(self):
+        return f"TokenBucket(calls_per_minute={self.calls_per_minute}, burst={self.burst})"
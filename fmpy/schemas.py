@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module holds the dtype schemas of the endpoints with large outputs. process_dataframe applies them
+if called with compact=True, e.g.
+
+    >>> get_stock_historical_price('AAPL', compact=True)
+
+Columns listed in the schema are cast to the given dtype, all other columns are downcast generically:
+float64 to float32 unless that loses precision, int64 to the smallest integer type that holds the values
+and repetitive strings to category.
+Integer columns that don't fit into the schema dtype are cast to the next wider integer type,
+integer columns with missing values stay float.
+"""
+
+__all__ = [
+    'SCHEMAS',
+    'compact_frame',
+]
+
+_PRICE = {
+    'open': 'float32',
+    'high': 'float32',
+    'low': 'float32',
+    'close': 'float32',
+    'adj_close': 'float32',
+    'change': 'float32',
+    'change_percent': 'float32',
+    'change_over_time': 'float32',
+    'vwap': 'float32',
+    'volume': 'int32',
+    'unadjusted_volume': 'int32',
+    'label': 'category',
+}
+
+# snake case column -> dtype, per endpoint
+SCHEMAS = {
+    'historical_price': _PRICE,
+    'historical_chart': {key: _PRICE[key] for key in ('open', 'high', 'low', 'close', 'volume')},
+    'quotes': {
+        'price': 'float32',
+        'changes_percentage': 'float32',
+        'change': 'float32',
+        'day_low': 'float32',
+        'day_high': 'float32',
+        'year_high': 'float32',
+        'year_low': 'float32',
+        'market_cap': 'float64',
+        'price_avg50': 'float32',
+        'price_avg200': 'float32',
+        'exchange': 'category',
+        'volume': 'int32',
+        'avg_volume': 'int32',
+        'open': 'float32',
+        'previous_close': 'float32',
+        'eps': 'float32',
+        'pe': 'float32',
+        'earnings_announcement': 'datetime64[ns]',
+        'shares_outstanding': 'float64',
+        'timestamp': 'int64',
+    },
+    'symbols_list': {
+        'price': 'float32',
+        'exchange': 'category',
+        'exchange_short_name': 'category',
+        'type': 'category',
+    },
+    'insider_trading': {
+        'transaction_date': 'datetime64[ns]',
+        'reporting_cik': 'category',
+        'company_cik': 'category',
+        'transaction_type': 'category',
+        'securities_owned': 'float64',
+        'type_of_owner': 'category',
+        'acquistion_or_disposition': 'category',
+        'form_type': 'category',
+        'securities_transacted': 'float64',
+        'price': 'float32',
+        'security_name': 'category',
+    },
+    'form_13F': {
+        'accepted_date': 'datetime64[ns]',
+        'cik': 'category',
+        'shares': 'int32',
+        'title_of_class': 'category',
+        'value': 'int32',
+    },
+    'shares_float': {
+        'free_float': 'float32',
+        'float_shares': 'float64',
+        'outstanding_shares': 'float64',
+        'source': 'category',
+    },
+}
+
+_INT_TYPES = ('int8', 'int16', 'int32', 'int64')
+
+
+def _fits(values: np.ndarray, dtype: str) -> bool:
+    if len(values) == 0:
+        return True
+    info = np.iinfo(dtype)
+    return info.min <= values.min() and values.max() <= info.max
+
+
+def _fits_float32(values: np.ndarray) -> bool:
+    """
+    Whether float32 keeps the values, i.e. they round-trip exactly or are below 2 ** 24 with at most
+    6 significant digits, the decimal precision of float32. Large amounts like market caps or revenues
+    lose whole units in float32 and stay float64.
+    """
+    compact = values.astype('float32').astype(values.dtype)
+    if np.array_equal(compact, values, equal_nan=True):
+        return True
+    if not np.nanmax(np.abs(values)) < 2 ** 24:
+        return False
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponent = np.floor(np.log10(np.abs(values)))
+        scale = 10. ** (5 - np.where(np.isfinite(exponent), exponent, 0))
+        restored = np.round(compact * scale) / scale
+    return bool(np.allclose(restored, values, rtol=1e-12, atol=0, equal_nan=True))
+
+
+def _cast(column: pd.Series, dtype: str) -> pd.Series:
+    if dtype.startswith('datetime64'):
+        # timestamps with an offset, e.g. '2024-01-25T21:30:00.000+0000', are converted to naive UTC
+        return pd.to_datetime(column, format='ISO8601', errors='coerce', utc=True).dt.tz_localize(None).astype(dtype)
+    if dtype == 'category':
+        return column.astype('category')
+    numeric = pd.to_numeric(column, errors='coerce')
+    if dtype in _INT_TYPES:
+        if numeric.isna().any():
+            return numeric
+        values = numeric.to_numpy()
+        for wider in _INT_TYPES[_INT_TYPES.index(dtype):]:
+            if _fits(values, wider):
+                return numeric.astype(wider)
+        return numeric
+    return numeric.astype(dtype)
+
+
+def _downcast(column: pd.Series) -> pd.Series:
+    kind = column.dtype.kind
+    if kind == 'f' and column.dtype.itemsize > 4:
+        return column.astype('float32') if _fits_float32(column.to_numpy()) else column
+    if kind in 'iu':
+        values = column.to_numpy()
+        for dtype in _INT_TYPES:
+            if _fits(values, dtype):
+                return column.astype(dtype) if np.dtype(dtype).itemsize < column.dtype.itemsize else column
+        return column
+    if kind in 'OT' or isinstance(column.dtype, pd.StringDtype):
+        # only worthwhile for repetitive strings
+        if len(column) > 0 and column.nunique(dropna=True) <= len(column) // 2:
+            return column.astype('category')
+    return column
+
+
+def compact_frame(df: DataFrame, schema: str = None) -> DataFrame:
+    """
+    Parameters
+    ----------
+    df: DataFrame as built by process_dataframe, before transposing
+    schema: (str) key of SCHEMAS, None downcasts all columns generically
+    """
+    dtypes = SCHEMAS[schema] if schema is not None else {}
+    for col in df.columns:
+        if isinstance(df[col], DataFrame):
+            # duplicated column names
+            continue
+        df[col] = _cast(df[col], dtypes[col]) if col in dtypes else _downcast(df[col])
+    return df
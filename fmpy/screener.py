@@ -0,0 +1,167 @@
+import os
+import time
+import pickle
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+from . import bulk
+from .cache import bypass
+from .schemas import compact_frame
+from .stock_price import get_stock_price_list
+from .stock_look_up_tool import stock_screener
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module screens a local snapshot of the stock universe, e.g.
+
+    >>> from fmpy.screener import Screener
+    >>> screener = Screener(path='./universe.pkl')
+    >>> screener.screen(market_cap_more_than=1e10, sector='Technology', pe_lower_than=30)
+    >>> screener.screen(exchange_short_name=['NYSE', 'NASDAQ'], dividend_more_than=1, sort_by='market_cap')
+
+The snapshot joins the quotes of all listed exchanges with the company profile fields (sector, industry,
+country, beta, dividend, ...) into one compact frame. It is downloaded once and kept in memory and on disk,
+so repeated screens with different thresholds run as NumPy boolean masks in milliseconds.
+"""
+
+__all__ = [
+    'Screener',
+]
+
+DAY = 24 * 60 * 60
+
+# filter names of the FMP screener that differ from the snapshot columns
+_ALIASES = {
+    'dividend': 'last_annual_dividend',
+}
+
+
+class Screener:
+
+    def __init__(self, exchanges: Iterable[str] = ('nyse', 'nasdaq', 'amex'), path: str = None,
+                 max_age: float = DAY):
+        """
+        Parameters
+        ----------
+        exchanges: (Iterable) exchanges whose quotes make up the universe
+        path: (str) file the snapshot is saved to and loaded from
+        max_age: (float) seconds after which the snapshot is downloaded again on the next screen
+        """
+        self.exchanges = list(exchanges)
+        self.path = path
+        self.max_age = max_age
+        self._frame = None
+        self._built = None
+        self._arrays = {}
+
+    def refresh(self) -> pd.DataFrame:
+        """Downloads the quotes and profiles of the universe into a new snapshot."""
+        with bypass():
+            results, errors = bulk.map(get_stock_price_list, self.exchanges)
+            if errors:
+                raise next(iter(errors.values()))
+            # the FMP screener returns the profile fields of the whole universe in a single request
+            profiles = stock_screener(exchange=[exchange.upper() for exchange in self.exchanges],
+                                      limit=1000000)
+        quotes = pd.concat(results.values())
+        quotes = quotes[~quotes.index.duplicated()]
+        profiles = profiles[~profiles.index.duplicated()]
+        frame = quotes.join(profiles[profiles.columns.difference(quotes.columns)], how='left')
+        self._set(compact_frame(frame, 'quotes'), time.time())
+        if self.path is not None:
+            self.save()
+        return self._frame
+
+    def _set(self, frame: pd.DataFrame, built: float):
+        self._frame = frame
+        self._built = built
+        self._arrays = {}
+
+    def save(self, path: str = None):
+        path = path or self.path
+        if path is None:
+            raise AttributeError("Pass a path to save the snapshot to")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + '.tmp', 'wb') as file:
+            pickle.dump({'frame': self._frame, 'built': self._built}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+
+    def load(self, path: str = None) -> pd.DataFrame:
+        with open(path or self.path, 'rb') as file:
+            data = pickle.load(file)
+        self._set(data['frame'], data['built'])
+        return self._frame
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The snapshot, loaded from disk or downloaded if it is missing or older than max_age."""
+        if self._frame is None and self.path is not None and os.path.isfile(self.path):
+            self.load()
+        if self._frame is None or time.time() - self._built > self.max_age:
+            self.refresh()
+        return self._frame
+
+    def _array(self, column: str) -> np.ndarray:
+        # numeric columns as float arrays, missing values are NaN and fail every comparison
+        if column not in self._arrays:
+            self._arrays[column] = pd.to_numeric(self.frame[column], errors='coerce').to_numpy(dtype='float64')
+        return self._arrays[column]
+
+    def _equals(self, column: str, value) -> np.ndarray:
+        values = [value] if isinstance(value, (str, bool, int, float)) else list(value)
+        series = self.frame[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # compare the integer codes instead of the strings
+            codes = series.cat.categories.get_indexer(values)
+            return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+        return series.isin(values).to_numpy()
+
+    def mask(self, **conditions) -> np.ndarray:
+        """
+        Returns the boolean mask of the rows meeting all conditions, see screen().
+        """
+        frame = self.frame
+        mask = np.ones(len(frame), dtype=bool)
+        for name, value in conditions.items():
+            if value is None:
+                continue
+            for suffix, compare in (('_more_than', np.greater), ('_lower_than', np.less)):
+                if name.endswith(suffix):
+                    column = name[:-len(suffix)]
+                    column = _ALIASES.get(column, column)
+                    if column not in frame.columns:
+                        raise AttributeError(f"Couldn't find {column} in snapshot columns")
+                    mask &= compare(self._array(column), value)
+                    break
+            else:
+                if name not in frame.columns:
+                    raise AttributeError(f"Couldn't find {name} in snapshot columns")
+                mask &= self._equals(name, value)
+        return mask
+
+    def screen(self, sort_by: str = None, ascending: bool = False, limit: int = None, **conditions) -> pd.DataFrame:
+        """
+        Parameters
+        ----------
+        sort_by: (str) column to sort the matches by, e.g. 'market_cap'
+        ascending: (bool) sort order
+        limit: (int) maximum number of matches
+        conditions: <column>_more_than=<value> and <column>_lower_than=<value> for numeric bounds on any
+                    snapshot column, e.g. market_cap_more_than=1e9 or pe_lower_than=20,
+                    <column>=<value or list of values> for exact matches, e.g. sector='Technology'
+                    or country=['US', 'CA']. dividend_* refers to the last annual dividend
+        """
+        df = self.frame[self.mask(**conditions)]
+        if sort_by is not None:
+            df = df.sort_values(sort_by, ascending=ascending)
+        if limit is not None:
+            df = df.iloc[:limit]
+        return df
+
+    def __repr__(self):
+        size = len(self._frame) if self._frame is not None else 0
+        return f"Screener(exchanges={self.exchanges}, symbols={size}, path={self.path!r})"
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 from typing import Union
 
 
@@ -23,10 +23,7 @@ __all__ = [
 def get_senate_trading(symbol: str, page: Union[int, str] = 0,
                        as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}senate-trading?symbol={symbol}&apikey={api_key}&page={page}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'last_name')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -36,10 +33,7 @@ def get_senate_trading(symbol: str, page: Union[int, str] = 0,
 def get_senate_trading_rss_feed(page: Union[int, str] = 0,
                                 as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}senate-trading-rss-feed?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'last_name')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -49,18 +43,12 @@ def get_senate_trading_rss_feed(page: Union[int, str] = 0,
 def get_senate_disclosure(symbol: str, page: Union[int, str] = 0,
                           as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}senate-disclosure?symbol={symbol}&page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_senate_disclosure_rss_feed(page: Union[int, str] = 0,
                                    as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v4}senate-disclosure-rss-feed?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
@@ -1,12 +1,10 @@
 # Helper functions and API Key for the user
 from .utils import *
-import requests
+from .client import get_json
 from pandas import DataFrame
 from typing import List, Union, Any, IO, Optional
 from datetime import datetime, date
 
-url_api = f"apikey={api_key}"
-
 __author__ = 'Lukas Schröder'
 __date__ = '2023-05-22'
 __version__ = '0.1.0'
@@ -74,10 +72,7 @@ def get_earnings_calendar(as_pandas: bool = True,
     url = f"{base_url_v3}earning_calendar?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -126,10 +121,7 @@ def get_historical_earning_calendar(symbol: str,
         >>> get_historical_earning_calendar('AAPL', limit=20, as_pandas=True)
     """
     url = f"{base_url_v3}historical/earning_calendar/{symbol}?limit={limit}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         return process_dataframe(json_data, *args, **kwargs)
     return json_data
@@ -182,10 +174,7 @@ def get_earnings_calendar_confirmed(as_pandas: bool = True,
     url = f"{base_url_v4}earning-calendar-confirmed?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         return process_dataframe(json_data, *args, **kwargs)
     return json_data
@@ -234,10 +223,7 @@ def get_ipo_calendar(as_pandas: bool = True,
     url = f"{base_url_v3}ipo_calendar?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -252,10 +238,7 @@ def get_ipo_calendar_with_prospectus(as_pandas: bool = True,
     url = f"{base_url_v4}ipo-calendar-prospectus?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -269,10 +252,7 @@ def get_ipo_calendar_confirmed(as_pandas: bool = True,
     url = f"{base_url_v4}ipo-calendar-confirmed?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -286,10 +266,7 @@ def get_stock_split_calendar(as_pandas: bool = True,
     url = f"{base_url_v3}stock_split_calendar?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&from={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -303,10 +280,7 @@ def get_dividend_calendar(as_pandas: bool = True,
     url = f"{base_url_v3}stock_dividend_calendar?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&from={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -316,10 +290,7 @@ def get_dividend_calendar(as_pandas: bool = True,
 def get_historical_dividends(symbol: str, as_pandas: bool = True,
                              *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}historical-price-full/stock_dividend/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data['historical']
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
@@ -331,9 +302,6 @@ def get_economic_calendar(as_pandas: bool = True,
     url = f"{base_url_v3}economic_calendar?apikey={api_key}"
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
@@ -1,14 +1,12 @@
 # Helper functions and API Key for the user
 from .utils import *
 
-import requests
+from .client import get_json
 from pandas import DataFrame, Series
 from types import SimpleNamespace
 from typing import List, Union, Any, Optional
 
 
-url_api = f"apikey={api_key}"
-
 __author__ = 'Lukas Schröder'
 __date__ = '2023-05-12'
 __version__ = '0.1.0'
@@ -36,6 +34,7 @@ __all__ = ['get_financial_statements_list',
            'get_rss_feed_8k_forms']
 
 
+@memoize()
 def get_financial_statements_list() -> List:
     """
     This endpoint allows you to get a list of all companies for which the API has financial statements.
@@ -50,10 +49,7 @@ def get_financial_statements_list() -> List:
     """
     category = 'financial-statement-symbol-lists'
     url = f"{base_url_v3}{category}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data: list = response.json()
+    json_data: list = get_json(url)
     return json_data
 
 
@@ -114,10 +110,7 @@ def get_income_statement(symbol: str, limit: Union[int, str] = 120, period: str
     """
     statement = 'income-statement-as-reported' if as_reported else 'income-statement'
     url = f"{base_url_v3}{statement}/{symbol}?limit={limit}&period={period}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         transpose = kwargs.pop('transpose_', True)
         return process_dataframe(json_data, transpose_=transpose, *args, **kwargs)
@@ -163,11 +156,7 @@ def get_balance_sheet_statement(symbol: str, limit: Union[int, str] = 120, perio
     """
     statement = 'balance-sheet-statement-as-reported' if as_reported else 'balance-sheet-statement'
     url = f"{base_url_v3}{statement}/{symbol}?limit={limit}&period={period}&apikey={api_key}"
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         transpose = kwargs.pop('transpose_', True)
         return process_dataframe(json_data, transpose_=transpose, *args, **kwargs)
@@ -226,10 +215,7 @@ def get_cashflow_statement(symbol: str, limit: Union[int, str] = 120, period: st
     """
     statement = 'cash-flow-statement-as-reported' if as_reported else 'cash-flow-statement'
     url = f"{base_url_v3}{statement}/{symbol}?limit={limit}&period={period}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         transpose = kwargs.pop('transpose_', True)
         return process_dataframe(json_data, transpose_=transpose, *args, **kwargs)
@@ -285,10 +271,7 @@ def get_shares_float_symbol(symbol: Union[str, list], as_pandas: bool = True,
             return data.loc[symbol]
         return data
     url = f'{base_url_v4}shares_float?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     if as_pandas:
         data = convert_dict_keys_to_snake_case(data)
@@ -333,13 +316,10 @@ def get_shares_float_all(as_pandas: bool = True,
         >>> get_shares_float_all(as_pandas=True)
     """
     url = f'{base_url_v4}shares_float/all?apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_, *args, **kwargs)
+        return process_dataframe(json_data, index_, schema_='shares_float', *args, **kwargs)
     return json_data
 
 
@@ -370,10 +350,7 @@ def get_earning_call_transcript_dates(symbol: str) -> List[list]:
         >>> get_earning_call_transcript_dates('AAPL')
     """
     url = f'{base_url_v4}earning_call_transcript?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    return response.json()
+    return get_json(url)
 
 
 
@@ -428,10 +405,7 @@ def get_earning_call_transcript(symbol: str, quarter: Union[int, str] = 1,
     url = f'{base_url_v3}earning_call_transcript/{symbol}?quarter={str(quarter)}&year={str(year)}&apikey={api_key}'
     if batch:
         url = f'{base_url_v4}batch_earning_call_transcript/{symbol}?year={str(year)}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if batch:
         return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
     data = json_data[0]
@@ -487,10 +461,7 @@ def get_sec_filings(symbol: str, as_pandas: bool = True, type_: Optional[str] =
     url = url + f'&type={type_}' if type_ is not None else url
     url = url + f'&limit={limit}' if limit is not None else url
 
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
 
     if as_pandas:
         index_ = kwargs.pop('index_', 'filing_date')
@@ -534,10 +505,7 @@ def get_company_notes(symbol: str, as_pandas: bool = True, *args, **kwargs) -> U
         >>> get_company_notes('AAPL', as_pandas=True)
     """
     url = f'{base_url_v4}company-notes?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -582,11 +550,8 @@ def get_sales_and_revenue_by_segments(symbol: str, period: str = 'quarter', stru
     Example:
         >>> get_sales_and_revenue_by_segments('AAPL', period='annual', structure='flat', as_pandas=True)
     """
-    url = f"{base_url_v4}revenue-product-segmentation?symbol={symbol}&period={period}&structure={structure}&{url_api}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    url = f"{base_url_v4}revenue-product-segmentation?symbol={symbol}&period={period}&structure={structure}&apikey={api_key}"
+    json_data = get_json(url)
     if as_pandas:
         data = flatten_data(json_data)
         if structure != 'flat':
@@ -638,10 +603,7 @@ def get_revenue_geographic_by_segments(symbol: str, period: str = 'quarter', str
     """
     local_base = 'revenue-geographic-segmentation'
     url = f'{base_url_v4}{local_base}?symbol={symbol}&structure={structure}&period={period}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         data = flatten_data(json_data)
         if structure != 'flat':
@@ -686,10 +648,7 @@ def get_financial_reports_dates(symbol: str, as_pandas: bool = True, *args, **kw
         >>> get_financial_reports_dates('AAPL', as_pandas=True)
     """
     url = f'{base_url_v4}financial-reports-dates?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -744,10 +703,7 @@ def get_sec_rss_feed(page: Union[int, str] = 0, limit: Union[str, int] = 50,
     url = url + f"&to={to_}" if to_ is not None else url
     url = url + f"&isDone={is_done}" if is_done is not None else url
     url += f"&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -782,10 +738,7 @@ def get_reports_on_form_10k(symbol: str, year: Union[int, str] = 2023, quarter_p
         >>> get_reports_on_form_10k('AAPL', 2023, 'FY')
     """
     url = f"{base_url_v4}financial-reports-json?symbol={symbol}&year={year}&period={quarter_period}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    return response.json()
+    return get_json(url)
 
 
 def get_rss_feed_8k_forms(page: Union[int, str] = 0, from_: Optional[str] = None,
@@ -829,8 +782,5 @@ def get_rss_feed_8k_forms(page: Union[int, str] = 0, from_: Optional[str] = None
     url = url + f"&from={from_}" if from_ is not None else url
     url = url + f"&to={to_}" if to_ is not None else url
     url = url + f"&hasFinancial={has_financial}" if has_financial is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 
 from pandas import DataFrame, Series
 from types import SimpleNamespace
@@ -67,10 +67,7 @@ def get_company_financial_ratios(symbol: str, ttm: bool = True, period: str = 'q
     url_ = f'{base_url_v3}ratios-ttm/{symbol}?{period}' if ttm else f'{base_url_v3}ratios/{symbol}?{period}'
     url_ += f'&apikey={api_key}'
     url = url_ + f'&{limit}' if limit is not None else url_
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0] if ttm else json_data
     data = convert_dict_keys_to_snake_case(data) if ttm else data
     if as_pandas:
@@ -107,10 +104,7 @@ def get_score(symbol: str, as_pandas: bool = True):
         >>> get_score(symbol='AAPL', as_pandas=True)
     """
     url = f'{base_url_v4}score?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0])
     return Series(data) if as_pandas else SimpleNamespace(**data)
 
@@ -148,10 +142,7 @@ def get_owner_earnings(symbol: str, as_pandas: bool = True, *args, **kwargs) ->
         >>> get_owner_earnings(symbol='AAPL', as_pandas=True)
     """
     url = f'{base_url_v4}owner_earnings?symbol={symbol}&apikey={api_key}'
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -194,10 +185,7 @@ def get_company_enterprise_value(symbol: str, period: str = 'quarter',
     """
     url = f'{base_url_v3}enterprise-values/{symbol}?apikey={api_key}&period={period}'
     url = url + f'&limit={limit}' if limit is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -206,10 +194,7 @@ def get_income_statement_growth(symbol: str, limit: Optional[Union[str, int]] =
                                 as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f'{base_url_v3}income-statement-growth/{symbol}?apikey={api_key}'
     url = url + f'&limit={limit}' if limit is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -218,10 +203,7 @@ def get_balance_sheet_statement_growth(symbol: str, limit: Optional[Union[str, i
                                        as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f'{base_url_v3}balance-sheet-statement-growth/{symbol}?apikey={api_key}'
     url = url + f'&limit={limit}' if limit is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -230,10 +212,7 @@ def get_cashflow_statement_growth(symbol: str, limit: Optional[Union[str, int]]
                                   as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f'{base_url_v3}cash-flow-statement-growth/{symbol}?apikey={api_key}'
     url = url + f'&limit={limit}' if limit is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -244,10 +223,7 @@ def get_company_key_metrics(symbol: str, ttm: bool = True, period: str = 'quarte
     url_ = f'{base_url_v3}key-metrics-ttm/{symbol}?period={period}' if ttm else f'{base_url_v3}key-metrics/{symbol}?period={period}'
     url_ += f'&apikey={api_key}'
     url = url_ + f'&limit={limit}' if limit is not None else url_
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0] if ttm else json_data
     data = convert_dict_keys_to_snake_case(data) if ttm else data
     if as_pandas:
@@ -261,10 +237,7 @@ def get_company_financial_growth(symbol: str, period: str = 'quarter',
                                  as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f'{base_url_v3}financial-growth/{symbol}?apikey={api_key}&period={period}'
     url = url + f'limit={limit}' if limit is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -275,10 +248,7 @@ def get_company_rating(symbol: str, historical: bool = False,
     url_ = f'{base_url_v3}rating/{symbol}' if not historical else f'{base_url_v3}historical-rating/{symbol}'
     url_ += f'?apikey={api_key}'
     url = url_ + f'&limit={limit}' if limit is not None else url_
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if not historical:
         data = json_data[0] if len(json_data) > 0 else {'data': 'EmptyData'}
         data = convert_dict_keys_to_snake_case(data)
@@ -295,18 +265,12 @@ def get_discounted_cash_flow(symbol: str, advanced: bool = False,
     if advanced:
         url = f'{base_url_v4}advanced_levered_discounted_cash_flow?' if levered else f'{base_url_v4}advanced_discounted_cash_flow?'
         url += f'symbol={symbol}&apikey={api_key}'
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise APIRequestError(response.status_code)
-        json_data = response.json()
+        json_data = get_json(url)
         index_ = kwargs.pop('index_', 'year')
         return process_dataframe(json_data, index_=index_, *args, **kwargs) if as_pandas else json_data
     else:
         url = f'{base_url_v3}discounted-cash-flow/{symbol}?apikey={api_key}'
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise APIRequestError(response.status_code)
-        json_data = response.json()
+        json_data = get_json(url)
         data = json_data[0] if len(json_data) > 0 else {'dcf': 'no_data_found'}
         return data['dcf']
 
@@ -324,8 +288,5 @@ def get_historical_discounted_cashflow(symbol: str, as_pandas: bool = True,
         url = f'{base_url_v3}{base_param_p}/{symbol}'
         url += f'?apikey={api_key}&period={period}&limit={limit}' if limit is not None else f"?apikey={api_key}"
 
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
@@ -1,5 +1,5 @@
 from .utils import *
-import requests
+from .client import get_json
 import pandas as pd
 
 __author__ = 'Lukas Schröder'
@@ -17,36 +17,30 @@ __all__ = [
     'get_tradable_symbols_list',
 ]
 
+@memoize()
 def get_symbols_list(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}/stock/list?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='symbols_list', *args, **kwargs)
     return json_data
 
+@memoize()
 def get_tradable_symbols_list(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}/available-traded/list?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='symbols_list', *args, **kwargs)
     return json_data
 
 
+@memoize()
 def get_etf_list(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}/etf/list?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='symbols_list', *args, **kwargs)
     return json_data
@@ -1,8 +1,11 @@
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
-from typing import Union, Optional
+import contextvars
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Union, Optional, Iterable
 
 
 exchanges = ['ETF', 
@@ -32,19 +35,53 @@ provides section specific python functions.
 
 def get_company_search(query: str, exchange: str = 'ALL',
                        limit: Union[int, str] = 10, as_pandas=True,
-                       options: Optional[dict] = None, *args, **kwargs):
-    dataframes = []
-    dictionaries = {}
-    if exchange == 'ALL':
-        for exchange_ in exchanges:
-            if as_pandas:
-                df = get_company_search_(query, exchange_, limit, as_pandas, options, *args, **kwargs)
-                dataframes.append(df)
-            else:
-                data = get_company_search_(query, exchange_, limit, as_pandas, options, *args, **kwargs)
-                dictionaries.update(data)
-        return pd.concat(dataframes, axis=0)
-    return get_company_search_(query, exchange, limit, as_pandas, options, *args, **kwargs)
+                       options: Optional[dict] = None, first_n: Optional[int] = None,
+                       max_workers: int = len(exchanges), *args, **kwargs):
+    """
+    Search via ticker or company name, see get_company_search_.
+    With exchange='ALL' all exchanges are searched concurrently and the matches are merged
+    in the order of exchanges, keeping the first match per symbol.
+
+    Parameters
+    ----------
+    first_n: (int) returns as soon as first_n distinct symbols have been found, in the order the
+             exchanges answer. Meant for autocomplete, where latency matters more than completeness
+    max_workers: (int) maximum number of concurrent requests
+    """
+    if exchange != 'ALL':
+        return get_company_search_(query, exchange, limit, as_pandas, options, *args, **kwargs)
+    records = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # each request runs in a copy of the caller's context, so that fmpy.aio can serve the worker threads
+        futures = {executor.submit(contextvars.copy_context().run, get_company_search_,
+                                   query, exchange_, limit, False, options): exchange_
+                   for exchange_ in exchanges}
+        if first_n is not None:
+            for future in as_completed(futures):
+                for record in future.result():
+                    records.setdefault(record['symbol'], record)
+                if len(records) >= first_n:
+                    break
+            records = dict(list(records.items())[:first_n])
+        else:
+            # all requests end before the first error is raised, so that fmpy.aio fetches them in one pass
+            wait(futures)
+            results = {exchange_: future.result() for future, exchange_ in futures.items()}
+            for exchange_ in exchanges:
+                for record in results[exchange_]:
+                    records.setdefault(record['symbol'], record)
+    finally:
+        # the requests still running after an early return are not waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    json_data = list(records.values())
+    if as_pandas:
+        index_ = kwargs.pop('index_', 'symbol')
+        df: DataFrame = process_dataframe(json_data, index_, *args, **kwargs)
+        if df.empty:
+            print(f"Couldn't find any match for query {query}")
+        return df
+    return json_data
 
 def get_company_search_(query: str, exchange: str,
                        limit: Union[int, str] = 10, as_pandas=True,
@@ -66,10 +103,7 @@ def get_company_search_(query: str, exchange: str,
     else:
         local_base = 'search-ticker'
     url = f"{base_url_v3}{local_base}?query={query}&limit={limit}&exchange={exchange}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         df: DataFrame =  process_dataframe(json_data, index_, *args, **kwargs)
@@ -78,8 +112,20 @@ def get_company_search_(query: str, exchange: str,
         return df
     return json_data
 
-@not_implemented
-def stock_screener():
+def _to_camel_case(name: str) -> str:
+    first, *rest = name.split('_')
+    return first + ''.join(word.capitalize() for word in rest)
+
+
+def stock_screener(market_cap_more_than: float = None, market_cap_lower_than: float = None,
+                   price_more_than: float = None, price_lower_than: float = None,
+                   beta_more_than: float = None, beta_lower_than: float = None,
+                   volume_more_than: float = None, volume_lower_than: float = None,
+                   dividend_more_than: float = None, dividend_lower_than: float = None,
+                   is_etf: bool = None, is_actively_trading: bool = None,
+                   sector: str = None, industry: str = None, country: str = None,
+                   exchange: Union[str, Iterable[str]] = None, limit: Union[int, str] = None,
+                   as_pandas: bool = True, *args, **kwargs):
     """
     Stock screener is a more advanced way to search for stocks. 
     Unlike our search endpoint, there is no query parameter, but there are numerous parameters 
@@ -87,35 +133,44 @@ def stock_screener():
     For example, you can use this endpoint to find NASDAQ-listed software companies that 
     pay dividends and have good liquidity.
 
-    Params
-    --------------------
-
-    market_cap_more_than: 
-    market_cap_lower_than
-    price_more_than
-    price_lower_than
-    beta_more_than
-    beta_lower_than
-    volume_more_than
-    volume_lower_than
-    dividend_more_than
-    dividend_lower_than
-    is_etf
-    is_actively_trading
-    sector
-    industry
-    country
-    exchange
-    limit
+    Parameters
+    ----------
+    market_cap_more_than, market_cap_lower_than: (float) market capitalization bounds
+    price_more_than, price_lower_than: (float) price bounds
+    beta_more_than, beta_lower_than: (float) beta bounds
+    volume_more_than, volume_lower_than: (float) volume bounds
+    dividend_more_than, dividend_lower_than: (float) bounds of the last annual dividend
+    is_etf: (bool) only ETFs or only non-ETFs
+    is_actively_trading: (bool) only actively or only not actively traded securities
+    sector: (str) e.g. 'Technology'
+    industry: (str) e.g. 'Software'
+    country: (str) e.g. 'US'
+    exchange: (str or Iterable) e.g. 'NASDAQ' or ['NYSE', 'NASDAQ']
+    limit: (int) maximum number of results
+
+    For repeated screens of the same universe see fmpy.screener.Screener, which filters a local snapshot.
     """
-    pass
+    parameters = {key: value for key, value in locals().items()
+                  if key not in ('as_pandas', 'args', 'kwargs') and value is not None}
+    query = {}
+    for key, value in parameters.items():
+        if isinstance(value, bool):
+            value = str(value).lower()
+        elif not isinstance(value, (str, int, float)):
+            value = ','.join(value)
+        query[_to_camel_case(key)] = value
+    # sector and industry names contain '&', ',' and spaces, e.g. 'Oil & Gas E&P'
+    url = f"{base_url_v3}stock-screener?{urlencode(query)}&apikey={api_key}"
+    json_data = get_json(url)
+    if as_pandas:
+        index_ = kwargs.pop('index_', 'symbol')
+        return process_dataframe(json_data, index_, *args, **kwargs)
+    return json_data
 
 
+@memoize()
 def get_list_of_countries():
     url = f"{base_url_v3}get-all-countries?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    return response.json()
+    return get_json(url)
 
 
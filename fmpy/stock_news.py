@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
 from typing import Union, Iterable, Any
 
@@ -27,10 +27,7 @@ __all__ = [
 def get_fmp_articles(page: Union[int, str] = 0, size: Union[int, str] = 5, as_pandas: bool = True,
                      *args, **kwargs):
     url = f"{base_url_v3}fmp/articles?page={page}&size={size}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data['content']
     return process_dataframe(data, *args, **kwargs) if as_pandas else json_data
 
@@ -42,10 +39,7 @@ def get_stock_news(tickers: Union[str, Iterable],
     if not isinstance(tickers, str):
         tickers = ','.join(list(tickers))
     url = f"{base_url_v3}stock_news?tickers={tickers}&page={page}&limit={limit}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         return process_dataframe(json_data, *args, **kwargs)
     return json_data
@@ -57,10 +51,7 @@ def get_stock_news_with_sentiment(page: Union[int, str] = 0,
                                   as_pandas: bool = True,
                                   *args, **kwargs) -> Union[pd.DataFrame, list]:
     url = f"{base_url_v4}stock-news-sentiments-rss-feed?page={page}&limit={limit}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     index = kwargs.pop('index_', 'symbol')
     return process_dataframe(json_data, *args, **kwargs)
 
@@ -70,10 +61,7 @@ def get_crypto_news(symbol: str = None, page: Union[int, str] = 0, as_pandas: bo
                     *args, **kwargs):
     url = f"{base_url_v4}crypto_news?page={page}&apikey={api_key}"
     url = url + f"&symbol={symbol}" if symbol is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -82,10 +70,7 @@ def get_forex_news(symbol: str = None, page: Union[int, str] = 0, as_pandas: boo
                    *args, **kwargs):
     url = f"{base_url_v4}forex_news?page={page}&apikey={api_key}"
     url = url + f"&symbol={symbol}" if symbol is not None else url
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -93,10 +78,7 @@ def get_forex_news(symbol: str = None, page: Union[int, str] = 0, as_pandas: boo
 def get_general_news(page: Union[int, str] = 0, as_pandas: bool = True,
                      *args, **kwargs):
     url = f"{base_url_v4}general_news?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -104,8 +86,5 @@ def get_general_news(page: Union[int, str] = 0, as_pandas: bool = True,
 def get_press_releases(symbol: str, page: Union[int, str] = 0, as_pandas: bool = True,
                        *args, **kwargs):
     url = f"{base_url_v3}press-releases/{symbol}?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
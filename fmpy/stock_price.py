@@ -1,6 +1,9 @@
 from .utils import *
 
-import requests
+from .client import get_json
+from . import bulk
+from .schemas import compact_frame
+import numpy as np
 import pandas as pd
 import datetime as dt
 from typing import Union, Iterable
@@ -22,7 +25,9 @@ __all__ = [
     'get_stock_price_list',
     'get_historical_stock_split',
     'get_stock_historical_price',
+    'get_stock_historical_panel',
     'get_company_quote',
+    'get_quote_snapshot',
     'get_real_time_price',
     'get_real_time_volume',
     'get_survivorship_bias_free_eod',
@@ -30,14 +35,12 @@ __all__ = [
 
 
 def get_company_quote(tickers: Union[str, Iterable], as_pandas: bool = True):
-    if isinstance(tickers, list):
+    if not isinstance(tickers, str):
         tickers = ','.join(list(tickers))
     url = f"{base_url_v3}quote/{tickers}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
-    if len(tickers) > 5:
+    json_data = get_json(url)
+    # one quote per symbol, a single symbol is returned as Series
+    if ',' in tickers:
         if as_pandas:
             df = pd.DataFrame(json_data)
             df = convert_columns_to_snake_case(df)
@@ -50,15 +53,59 @@ def get_company_quote(tickers: Union[str, Iterable], as_pandas: bool = True):
     return SimpleNamespace(**data)
 
 
+# batch quote requests are bounded by the URL length only
+_QUOTE_CHUNK_SIZE = 200
+
+
+def _get_quote_chunk(chunk: str, endpoint: str) -> list:
+    url = f"{base_url_v3}{endpoint}/{chunk}?apikey={api_key}"
+    json_data = get_json(url)
+    return json_data if isinstance(json_data, list) else [json_data]
+
+
+def get_quote_snapshot(tickers: Union[str, Iterable], endpoint: str = 'quote', chunk_size: int = _QUOTE_CHUNK_SIZE,
+                       max_workers: int = 8, as_pandas: bool = True, *args, **kwargs):
+    """
+    Quotes of any number of symbols, e.g. a watchlist of thousands of names.
+    The symbols are split into batch requests that are fetched concurrently over the shared session.
+
+    Parameters
+    ----------
+    tickers: (str or Iterable) ticker symbols
+    endpoint: (str) 'quote' for full quotes, 'quote-short' for price and volume only
+              or 'otc/real-time-price' for OTC companies
+    chunk_size: (int) maximum number of symbols per request, chunks are also bounded by the URL length
+    max_workers: (int) maximum number of concurrent requests, see fmpy.bulk.map
+
+    Returns
+    -------
+    A DataFrame indexed by symbol with one row per quote, regardless of the number of symbols.
+    Chunks that could not be fetched are reported in a warning
+    """
+    if isinstance(tickers, str):
+        tickers = tickers.split(',')
+    chunks = _chunk_tickers(tickers, chunk_size)
+    results, errors = bulk.map(_get_quote_chunk, chunks, endpoint, max_workers=max_workers)
+    if errors:
+        warnings.warn(f"Could not fetch {len(errors)} of {len(chunks)} chunks: "
+                      + '; '.join(f"{chunk}: {error}" for chunk, error in errors.items()))
+    json_data = [quote for quotes in results.values() for quote in quotes if quote]
+    if as_pandas:
+        index_ = kwargs.pop('index_', 'symbol')
+        if len(json_data) == 0:
+            return pd.DataFrame(index=pd.Index([], name=index_))
+        schema_ = kwargs.pop('schema_', 'quotes')
+        return process_dataframe(json_data, index_=index_, schema_=schema_, *args, **kwargs)
+    return json_data
+
+
 def get_prices_of_otc_companies(tickers: Union[str, Iterable], as_pandas: bool = True):
     if not isinstance(tickers, str):
         tickers = ','.join(list(tickers))
     url = f"{base_url_v3}otc/real-time-price/{tickers}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
-    if len(tickers) > 5:
+    json_data = get_json(url)
+    # one quote per symbol, a single symbol is returned as Series
+    if ',' in tickers:
         if as_pandas:
             df = pd.DataFrame(json_data)
             df = convert_columns_to_snake_case(df)
@@ -73,14 +120,12 @@ def get_prices_of_otc_companies(tickers: Union[str, Iterable], as_pandas: bool =
 
 @in_development
 def get_stock_price_change(tickers: Union[str, Iterable], as_pandas: bool = True, *args, **kwargs):
-    if isinstance(tickers, list):
+    if not isinstance(tickers, str):
         tickers = ','.join(list(tickers))
     url = f"{base_url_v3}stock-price-change/{tickers}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
-    if len(tickers) > 5:
+    json_data = get_json(url)
+    # one quote per symbol, a single symbol is returned as Series
+    if ',' in tickers:
         if as_pandas:
             return process_dataframe(json_data, *args, **kwargs)
         return json_data
@@ -93,20 +138,14 @@ def get_stock_price_change(tickers: Union[str, Iterable], as_pandas: bool = True
 
 def get_real_time_price(symbol: str):
     url = f"{base_url_v3}quote-short/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     return data['price']
 
 
 def get_real_time_volume(symbol: str):
     url = f"{base_url_v3}quote-short/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = json_data[0]
     return data['volume']
 
@@ -114,13 +153,10 @@ def get_real_time_volume(symbol: str):
 @in_development
 def get_stock_price_list(exchange: str = 'nyse', as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/{exchange}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
@@ -141,52 +177,126 @@ def get_stock_historical_price(tickers: Union[str, Iterable],
         url += f"&timeseries={timeseries}"
     else:
         url += f"&from={from_}&to={to_}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         if interval is not None:
-            df = process_dataframe(json_data, *args, **kwargs)
-        elif len(tickers) > 5:
-            multi_df = pd.DataFrame()
-            for symbol_data in json_data['historicalStockList']:
-                symbol = symbol_data['symbol']
-                historical_data = symbol_data['historical']
-                df = pd.DataFrame(historical_data)
-                df = convert_columns_to_snake_case(df)
-                df['date'] = pd.to_datetime(df.date)
-                df.set_index('date', inplace=True)
-                df.columns = pd.MultiIndex.from_product([[symbol], df.columns])
-
-                if multi_df.empty:
-                    multi_df = df
-                else:
-                    multi_df = multi_df.join(df, how='outer')
-            return multi_df
+            df = process_dataframe(json_data, schema_='historical_chart', *args, **kwargs)
+        elif 'historicalStockList' in json_data:
+            return _to_panel(_historical_long(json_data['historicalStockList']), layout='columns')
         else:
-            df = process_dataframe(json_data['historical'], *args, **kwargs)
+            df = process_dataframe(json_data['historical'], schema_='historical_price', *args, **kwargs)
         return df
     return json_data
 
 
+# FMP serves at most 5 symbols per batch request of the daily history
+_CHUNK_SIZE = 5
+# conservative bound on the comma separated symbols in the URL path
+_MAX_URL_SYMBOLS_LENGTH = 1024
+
+
+def _chunk_tickers(tickers: Iterable[str], chunk_size: int = _CHUNK_SIZE,
+                   max_length: int = _MAX_URL_SYMBOLS_LENGTH) -> list:
+    chunks = []
+    chunk = []
+    length = 0
+    for ticker in dict.fromkeys(tickers):
+        if chunk and (len(chunk) >= chunk_size or length + len(ticker) > max_length):
+            chunks.append(','.join(chunk))
+            chunk = []
+            length = 0
+        chunk.append(ticker)
+        length += len(ticker) + 1
+    if chunk:
+        chunks.append(','.join(chunk))
+    return chunks
+
+
+def _historical_long(stock_list: list, columns: Iterable[str] = None) -> pd.DataFrame:
+    """Builds one frame indexed by (date, symbol) from the per-symbol histories of a batch response."""
+    stock_list = [stock for stock in stock_list if stock.get('historical')]
+    if len(stock_list) == 0:
+        return pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=['date', 'symbol']))
+    df = pd.DataFrame([record for stock in stock_list for record in stock['historical']])
+    df = convert_columns_to_snake_case(df)
+    symbols = np.repeat([stock['symbol'] for stock in stock_list],
+                        [len(stock['historical']) for stock in stock_list])
+    dates = pd.to_datetime(df.pop('date'), format='ISO8601')
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    df.index = pd.MultiIndex.from_arrays([dates, symbols], names=['date', 'symbol'])
+    return df
+
+
+def _to_panel(df: pd.DataFrame, layout: str = 'columns') -> pd.DataFrame:
+    if layout == 'long':
+        return df.sort_index()
+    if layout != 'columns':
+        raise ValueError(f"Invalid layout {layout}. Valid layouts are 'columns', 'long'")
+    symbols = df.index.get_level_values('symbol').unique()
+    fields = df.columns
+    df = df.unstack('symbol').swaplevel(axis=1)
+    return df.reindex(columns=pd.MultiIndex.from_product([symbols, fields])).sort_index()
+
+
+def _get_historical_chunk(chunk: str, from_: str, to_: str, serietype: str, columns: Iterable[str] = None):
+    url = f"{base_url_v3}historical-price-full/{chunk}?apikey={api_key}&seriestype={serietype}"
+    url += f"&from={from_}&to={to_}"
+    json_data = get_json(url)
+    # a single symbol is answered without the list wrapper
+    stock_list = json_data.get('historicalStockList', [json_data]) if isinstance(json_data, dict) else []
+    return _historical_long(stock_list, columns)
+
+
+def get_stock_historical_panel(tickers: Iterable[str], from_: str = '2008-01-01', to_: str = None,
+                               serietype: str = 'line', layout: str = 'columns', columns: Iterable[str] = None,
+                               chunk_size: int = _CHUNK_SIZE, max_workers: int = 8, compact: bool = False):
+    """
+    Daily price history of many symbols, e.g. a whole index universe over 15 years.
+    The symbols are split into batch requests of chunk_size symbols that are fetched concurrently,
+    every chunk is parsed into one frame and all chunks are assembled with a single concat.
+
+    Parameters
+    ----------
+    tickers: (Iterable) of ticker symbols
+    from_: (str) first date, 'YYYY-MM-DD'
+    to_: (str) last date, 'YYYY-MM-DD', defaults to today
+    serietype: (str) series type as in get_stock_historical_price
+    layout: (str) 'columns' returns a frame indexed by date with (symbol, field) columns,
+            'long' returns a frame indexed by (date, symbol) with one column per field
+    columns: (Iterable) fields to keep, e.g. ['adj_close', 'volume'], None keeps all
+    chunk_size: (int) number of symbols per request
+    max_workers: (int) maximum number of concurrent requests, see fmpy.bulk.map
+    compact: (bool) casts the fields to the compact dtypes of fmpy.schemas
+
+    Chunks that could not be fetched are reported in a warning, the panel holds all other symbols.
+    """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    to_ = to_ or str(dt.date.today())
+    chunks = _chunk_tickers(tickers, chunk_size)
+    results, errors = bulk.map(_get_historical_chunk, chunks, from_, to_, serietype, columns,
+                               max_workers=max_workers)
+    if errors:
+        warnings.warn(f"Could not fetch {len(errors)} of {len(chunks)} chunks: "
+                      + '; '.join(f"{chunk}: {error}" for chunk, error in errors.items()))
+    frames = [df for df in results.values() if not df.empty]
+    df = pd.concat(frames) if frames else _historical_long([])
+    if compact:
+        df = compact_frame(df, 'historical_price')
+    return _to_panel(df, layout)
+
+
 def get_historical_stock_split(symbol: str, as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}historical-price-full/stock_split/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data['historical'], *args, **kwargs) if as_pandas else json_data
 
 
 def get_survivorship_bias_free_eod(symbol: str, date: str = str(dt.date.today()),
                                    as_pandas: bool = True):
     url = f"{base_url_v4}historical-price-full/{symbol}/{date}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         return pd.Series(json_data)
     return SimpleNamespace(**json_data)
@@ -199,8 +309,5 @@ def get_technical_indicator(symbol: str, type_: str, interval='daily',
     else:
         url = f"{base_url_v3}technical_indicator/{interval}/{symbol}?type={type_}"
     url += f"&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
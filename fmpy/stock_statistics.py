@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 from pandas import Series, DataFrame
 from types import SimpleNamespace
 from typing import Union, Optional, Any
@@ -40,30 +40,21 @@ def get_social_sentiment(symbol: Optional[str] = None, page: Union[int, str] = 0
             url += f"&type={type_}"
         if source is not None:
             url += f"&source={source}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_stock_grade(symbol: str, limit: Union[int, str] = 500,
                     as_pandas: bool = True, *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}grade/{symbol}?limit={limit}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_earning_surprises(symbol: str, as_pandas: bool = True,
                           *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}earnings-surprises/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -73,10 +64,7 @@ def get_analyst_estimates(symbol: str, period: str = 'quarter',
                           as_pandas: bool = True,
                           *args, **kwargs) -> Union[DataFrame, Any]:
     url = f"{base_url_v3}analyst-estimates/{symbol}?limit={limit}&period={period}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
@@ -89,10 +77,7 @@ def get_merger_and_acquisition(search: bool = False, name: Optional[str] = None,
         raise AttributeError("If search is True you are required to pass a name")
     else:
         url = f"{base_url_v4}mergers-acquisitions/search?name={name}&apikey={api_key}&page={page}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas and search:
         data = convert_dict_keys_to_snake_case(json_data[0]) if len(json_data) > 0 else {'data': 'no_data'}
         return Series(data)
@@ -0,0 +1,249 @@
+import json
+import asyncio
+import threading
+import pandas as pd
+from collections import deque
+from typing import Callable, Iterable
+
+from .config import api_key
+from . import client as _client
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module streams real-time prices from the FMP websocket feeds for stocks, crypto and forex, e.g.
+
+    >>> from fmpy.stream import StreamClient
+    >>> stream = StreamClient('crypto', symbols=['btcusd', 'ethusd'])
+    >>> async for tick in stream:
+    ...     print(tick)
+
+or in a background thread with callbacks:
+
+    >>> stream = StreamClient('stocks', symbols=['aapl'], callback=print)
+    >>> stream.start()
+    >>> stream.subscribe('msft')
+    >>> stream.recent('aapl', as_pandas=True)
+    >>> stream.stop()
+
+The client logs in, subscribes and, after a dropped connection, reconnects with backoff and subscribes
+again to all symbols. The last buffer_size ticks per symbol are kept in a ring buffer.
+Requires the optional dependency websockets.
+"""
+
+__all__ = [
+    'FEEDS',
+    'StreamClient',
+]
+
+FEEDS = {
+    'stocks': 'wss://websockets.financialmodelingprep.com',
+    'crypto': 'wss://crypto.financialmodelingprep.com',
+    'forex': 'wss://forex.financialmodelingprep.com',
+}
+
+
+def _import_websockets():
+    try:
+        import websockets
+    except ImportError as e:
+        raise ImportError("fmpy.stream requires websockets, install it with 'pip install websockets'") from e
+    return websockets
+
+
+class StreamClient:
+
+    def __init__(self, feed: str = 'stocks', symbols: Iterable[str] = (), callback: Callable = None,
+                 buffer_size: int = 1000, queue_size: int = 10000, url: str = None):
+        """
+        Parameters
+        ----------
+        feed: (str) 'stocks', 'crypto' or 'forex'
+        symbols: (Iterable) symbols subscribed to on connect, e.g. ['aapl'] or ['btcusd']
+        callback: (Callable) called with every tick, more can be added with add_callback
+        buffer_size: (int) number of recent ticks kept per symbol
+        queue_size: (int) number of ticks buffered for the iterator, the oldest are dropped if it falls behind
+        url: (str) websocket URL overriding the feed, e.g. of a local test server
+        """
+        if url is None and feed not in FEEDS:
+            raise ValueError(f"Invalid feed {feed}. Valid feeds are {', '.join(FEEDS)}")
+        self.url = url or FEEDS[feed]
+        self.buffer_size = buffer_size
+        self.queue_size = queue_size
+        self.callbacks = [callback] if callback is not None else []
+        self.symbols = set()
+        # guards symbols, which are changed from any thread and read by the loop on reconnect
+        self._lock = threading.Lock()
+        self._buffers = {}
+        self._queue = None
+        self._websocket = None
+        self._loop = None
+        self._thread = None
+        self._closed = False
+        self._running = False
+        self.subscribe(*symbols)
+
+    @staticmethod
+    def _normalize(symbols) -> list:
+        return [symbol.lower() for symbol in symbols]
+
+    def add_callback(self, callback: Callable):
+        self.callbacks.append(callback)
+
+    def _schedule(self, message: dict):
+        # subscriptions may be changed from any thread, they are sent from the loop of the connection
+        if self._loop is not None and self._websocket is not None:
+            self._loop.call_soon_threadsafe(lambda: asyncio.ensure_future(self._send_subscription(message)))
+
+    def subscribe(self, *symbols: str):
+        with self._lock:
+            symbols = [symbol for symbol in dict.fromkeys(self._normalize(symbols)) if symbol not in self.symbols]
+            self.symbols.update(symbols)
+        if symbols:
+            self._schedule({'event': 'subscribe', 'data': {'ticker': symbols}})
+
+    def unsubscribe(self, *symbols: str):
+        with self._lock:
+            symbols = [symbol for symbol in dict.fromkeys(self._normalize(symbols)) if symbol in self.symbols]
+            self.symbols.difference_update(symbols)
+        if symbols:
+            self._schedule({'event': 'unsubscribe', 'data': {'ticker': symbols}})
+
+    async def _send(self, message: dict):
+        websocket = self._websocket
+        if websocket is not None:
+            await websocket.send(json.dumps(message))
+
+    async def _send_subscription(self, message: dict):
+        websockets = _import_websockets()
+        try:
+            await self._send(message)
+        except websockets.exceptions.WebSocketException:
+            # the connection dropped meanwhile, all subscriptions are sent again on reconnect
+            pass
+
+    def _handle(self, raw):
+        try:
+            message = _client.loads(raw)
+        except ValueError:
+            # a malformed frame is dropped, the connection stays up
+            return
+        for tick in message if isinstance(message, list) else [message]:
+            if not isinstance(tick, dict) or 's' not in tick:
+                # login and subscription acknowledgements
+                continue
+            symbol = tick['s'].lower()
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                buffer = self._buffers[symbol] = deque(maxlen=self.buffer_size)
+            buffer.append(tick)
+            if self._queue is not None:
+                if self._queue.full():
+                    self._queue.get_nowait()
+                self._queue.put_nowait(tick)
+            for callback in self.callbacks:
+                try:
+                    callback(tick)
+                except Exception as e:
+                    # a failing callback must not end the stream or starve the other callbacks
+                    print(f"Stream callback failed: {e!r}")
+
+    async def run(self):
+        """Connects and receives ticks until close() is called, reconnecting after connection losses."""
+        self._closed = False
+        await self._run()
+
+    async def _run(self):
+        websockets = _import_websockets()
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        try:
+            await self._receive(websockets)
+        finally:
+            self._running = False
+
+    async def _receive(self, websockets):
+        attempt = 0
+        while not self._closed:
+            try:
+                async with websockets.connect(self.url) as websocket:
+                    self._websocket = websocket
+                    if self._closed:
+                        # stop() was called while connecting
+                        break
+                    await self._send({'event': 'login', 'data': {'apiKey': str(api_key)}})
+                    with self._lock:
+                        symbols = sorted(self.symbols)
+                    if symbols:
+                        await self._send({'event': 'subscribe', 'data': {'ticker': symbols}})
+                    attempt = 0
+                    async for raw in websocket:
+                        self._handle(raw)
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException):
+                pass
+            finally:
+                self._websocket = None
+            if self._closed:
+                break
+            attempt += 1
+            await asyncio.sleep(_client.retry_delay(attempt))
+
+    async def close(self):
+        self._closed = True
+        websocket = self._websocket
+        if websocket is not None:
+            await websocket.close()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        # consume a connection run elsewhere in this loop, or open one for the iteration
+        task = None if self._running else asyncio.ensure_future(self.run())
+        try:
+            while True:
+                yield await self._queue.get()
+        finally:
+            self._queue = None
+            if task is not None:
+                await self.close()
+                task.cancel()
+
+    def start(self):
+        """Runs the client in a background thread, ticks are delivered to the callbacks and ring buffers."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._closed = False
+        self._thread = threading.Thread(target=asyncio.run, args=(self._run(),),
+                                        name='fmpy-stream', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        # set right away, the thread may not have started its loop yet
+        self._closed = True
+        if self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.close(), self._loop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def connected(self) -> bool:
+        return self._websocket is not None
+
+    def recent(self, symbol: str, as_pandas: bool = False):
+        """Returns the buffered ticks of the symbol, oldest first."""
+        ticks = list(self._buffers.get(symbol.lower(), ()))
+        if as_pandas:
+            df = pd.DataFrame(ticks)
+            if 't' in df.columns:
+                # FMP sends the timestamps in nanoseconds
+                df.index = pd.to_datetime(df.pop('t'), unit='ns')
+            return df
+        return ticks
+
+    def __repr__(self):
+        return f"StreamClient(url={self.url!r}, symbols={len(self.symbols)}, connected={self.connected})"
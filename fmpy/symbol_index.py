@@ -0,0 +1,229 @@
+import os
+import re
+import time
+import pickle
+import threading
+from bisect import bisect_left
+from typing import Iterable, Union
+
+from .utils import process_dataframe
+from .cache import bypass
+from .stock_list import get_symbols_list, get_tradable_symbols_list, get_etf_list
+
+__author__ = 'Lukas Schröder'
+__date__ = '2026-10-18'
+__version__ = '0.1.0'
+
+__doc__ = """
+This module provides an offline symbol search for autocomplete, built once from the symbol lists of the API, e.g.
+
+    >>> from fmpy.symbol_index import SymbolIndex
+    >>> index = SymbolIndex.open('./symbols.pkl', max_age=86400)
+    >>> index.search('appl')
+    >>> index.search('micro soft', exchange='NASDAQ')
+
+Tickers are matched by prefix, company names by their words, with the last word of the query taken as prefix.
+Lookups run in memory without touching the API. The index is persisted with save() and rebuilt
+from the API when it is older than max_age, or periodically in the background with start_refresh().
+"""
+
+__all__ = [
+    'SymbolIndex',
+]
+
+DAY = 24 * 60 * 60
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+def _tokenize(text: str) -> list:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def _prefix_range(keys: list, prefix: str) -> range:
+    """Positions of the keys starting with prefix in the sorted list keys."""
+    start = bisect_left(keys, prefix)
+    # '\uffff' sorts after every character that can follow the prefix
+    return range(start, bisect_left(keys, prefix + '\uffff', lo=start))
+
+
+class _Index:
+    """Immutable lookup structures over a list of symbol records, swapped as a whole on refresh."""
+
+    def __init__(self, records: list, built: float):
+        self.records = records
+        self.built = built
+        order = sorted(range(len(records)), key=lambda i: records[i]['symbol'].upper())
+        # sorted tickers for prefix lookups with bisect, the flat equivalent of a prefix trie
+        self.symbols = [records[i]['symbol'].upper() for i in order]
+        self.symbol_ids = order
+        tokens = {}
+        for i, record in enumerate(records):
+            for token in set(_tokenize(record.get('name'))):
+                tokens.setdefault(token, []).append(i)
+        self.tokens = sorted(tokens)
+        self.token_ids = [tokens[token] for token in self.tokens]
+
+
+class SymbolIndex:
+
+    def __init__(self, records: Iterable[dict] = (), path: str = None, built: float = None):
+        """
+        Parameters
+        ----------
+        records: (Iterable) of symbol records as returned by get_symbols_list(as_pandas=False)
+        path: (str) file the index is saved to and loaded from
+        built: (float) unix time the records were fetched at, defaults to now
+        """
+        self.path = path
+        self._index = _Index(list(records), built or time.time())
+        self._refresh_thread = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def fetch_records() -> list:
+        """Downloads the stock, tradable and ETF symbol lists, the first record per symbol is kept."""
+        records = {}
+        for func in (get_symbols_list, get_tradable_symbols_list, get_etf_list):
+            for record in func(as_pandas=False):
+                if record.get('symbol'):
+                    records.setdefault(record['symbol'], record)
+        return list(records.values())
+
+    @classmethod
+    def build(cls, path: str = None):
+        index = cls(cls.fetch_records(), path)
+        if path is not None:
+            index.save()
+        return index
+
+    @classmethod
+    def load(cls, path: str):
+        index = cls(path=path)
+        with open(path, 'rb') as file:
+            # the lookup structures are stored as well, so loading doesn't have to rebuild them
+            index._index = pickle.load(file)
+        return index
+
+    @classmethod
+    def open(cls, path: str, max_age: float = DAY):
+        """Loads the index saved at path, it is built from the API if it doesn't exist or is older than max_age."""
+        if os.path.isfile(path):
+            index = cls.load(path)
+            if index.age <= max_age:
+                return index
+        return cls.build(path)
+
+    def save(self, path: str = None):
+        path = path or self.path
+        if path is None:
+            raise AttributeError("Pass a path to save the index to")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path + '.tmp', 'wb') as file:
+            pickle.dump(self._index, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self._index.built
+
+    def refresh(self):
+        """Rebuilds the index from the API and saves it, lookups keep using the old index meanwhile."""
+        # skip the memoized and cached symbol lists, they may be as old as the index
+        with bypass():
+            records = self.fetch_records()
+        self._index = _Index(records, time.time())
+        if self.path is not None:
+            self.save()
+
+    def start_refresh(self, interval: float = DAY):
+        """Refreshes the index every interval seconds in a background thread."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(max(0., interval - self.age)):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    # keep serving the current index, the next attempt follows after another interval
+                    print(f"Couldn't refresh the symbol index: {e}")
+                    self._stop.wait(interval)
+
+        self._refresh_thread = threading.Thread(target=run, name='fmpy-symbol-index-refresh', daemon=True)
+        self._refresh_thread.start()
+
+    def stop_refresh(self):
+        self._stop.set()
+
+    def search(self, query: str, limit: int = 10, exchange: Union[str, Iterable[str]] = None,
+               type_: str = None, as_pandas: bool = False):
+        """
+        Parameters
+        ----------
+        query: (str) ticker prefix or words of the company name
+        limit: (int) maximum number of matches
+        exchange: (str or Iterable) exchange short names to filter by, e.g. 'NASDAQ' or ['NYSE', 'AMEX']
+        type_: (str) security type to filter by, e.g. 'stock', 'etf' or 'trust'
+        as_pandas: (bool) returns a DataFrame indexed by symbol instead of the records
+
+        Exact ticker matches come first, then ticker prefix matches by length, then company name matches.
+        """
+        index = self._index
+        if isinstance(exchange, str):
+            exchange = {exchange}
+        elif exchange is not None:
+            exchange = set(exchange)
+
+        def accept(record):
+            return ((exchange is None or record.get('exchangeShortName') in exchange)
+                    and (type_ is None or record.get('type') == type_))
+
+        matches = {}
+        prefix = query.strip().upper()
+        if prefix:
+            ids = [index.symbol_ids[position] for position in _prefix_range(index.symbols, prefix)]
+            # shorter tickers first, an exact match is the shortest
+            ids.sort(key=lambda i: len(index.records[i]['symbol']))
+            for i in ids:
+                if len(matches) >= limit:
+                    break
+                if accept(index.records[i]):
+                    matches[i] = None
+
+        tokens = _tokenize(query)
+        if len(matches) < limit and tokens:
+            *words, last = tokens
+            candidates = None
+            # complete words narrow the candidates down by set intersection
+            for word in words:
+                position = bisect_left(index.tokens, word)
+                found = position < len(index.tokens) and index.tokens[position] == word
+                ids = set(index.token_ids[position]) if found else set()
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    break
+            # the last word may still be typed and is matched as prefix
+            if candidates is None:
+                ids = (i for position in _prefix_range(index.tokens, last) for i in index.token_ids[position])
+            else:
+                ids = (i for i in sorted(candidates)
+                       if any(token.startswith(last) for token in _tokenize(index.records[i].get('name'))))
+            for i in ids:
+                if len(matches) >= limit:
+                    break
+                if i not in matches and accept(index.records[i]):
+                    matches[i] = None
+
+        records = [index.records[i] for i in matches]
+        if as_pandas:
+            return process_dataframe(records, index_='symbol')
+        return records
+
+    def __len__(self):
+        return len(self._index.records)
+
+    def __repr__(self):
+        return f"SymbolIndex(symbols={len(self)}, path={self.path!r}, age={self.age:.0f}s)"
@@ -1,7 +1,7 @@
 from .utils import *
 
 import pandas as pd
-import requests
+from .client import get_json
 from types import SimpleNamespace
 from typing import Iterable, Union
 
@@ -24,10 +24,7 @@ __all__ = [
 
 def get_available_tsx_symbols(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}symbol/available-tsx?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, index_=index_, *args, **kwargs)
@@ -36,13 +33,10 @@ def get_available_tsx_symbols(as_pandas: bool = True, *args, **kwargs):
 
 def get_all_real_time_tsx_prices(as_pandas: bool = True, *args, **kwargs):
     url = f"{base_url_v3}quotes/tsx?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
         index_ = kwargs.pop('index_', 'symbol')
-        return process_dataframe(json_data, index_=index_, *args, **kwargs)
+        return process_dataframe(json_data, index_=index_, schema_='quotes', *args, **kwargs)
     return json_data
 
 
@@ -51,10 +45,7 @@ def get_real_time_tsx_price(symbol: Union[str, Iterable] = 'FNV.TO',
     if not isinstance(symbol, str):
         symbol = ','.join(list(symbol))
     url = f"{base_url_v3}quote/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     if count_string_chars(symbol, ',') > 0:
         index_ = kwargs.pop('index_', 'symbol')
         return process_dataframe(json_data, *args, **kwargs)
@@ -71,12 +62,8 @@ def get_historical_tsx_prices(symbol: str, interval: str = None,
     else:
         local_base = f"{base_url_v3}historical-price-full"
     url = f"{local_base}/{symbol}?apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-
-    json_data = response.json()
+    json_data = get_json(url)
     if as_pandas:
-        return process_dataframe(json_data, *args, **kwargs) if interval is not None else process_dataframe(
-            json_data['historical'], *args, **kwargs)
+        return process_dataframe(json_data, schema_='historical_chart', *args, **kwargs) if interval is not None \
+            else process_dataframe(json_data['historical'], schema_='historical_price', *args, **kwargs)
     return json_data
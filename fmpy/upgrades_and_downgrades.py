@@ -1,6 +1,6 @@
 from .utils import *
 
-import requests
+from .client import get_json
 import pandas as pd
 from types import SimpleNamespace
 from typing import Union
@@ -23,28 +23,19 @@ __all__ = [
 @in_development
 def get_upgrades_and_downgrades(symbol: str, as_pandas=True, *args, **kwargs):
     url = f"{base_url_v4}upgrades-downgrades?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_upgrades_and_downgrades_rss_feed(page: Union[str, int] = 0, as_pandas=True, *args, **kwargs):
     url = f"{base_url_v4}upgrades-downgrades-rss-feed?page={page}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
 
 
 def get_upgrades_and_downgrades_consensus(symbol: str, as_pandas=True):
     url = f"{base_url_v4}upgrades-downgrades-consensus?symbol={symbol}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     data = convert_dict_keys_to_snake_case(json_data[0])
     if as_pandas:
         return pd.Series(data)
@@ -53,8 +44,5 @@ def get_upgrades_and_downgrades_consensus(symbol: str, as_pandas=True):
 
 def get_upgrades_and_downgrades_by_company(company: str, as_pandas=True, *args, **kwargs):
     url = f"{base_url_v4}upgrades-downgrades-grading-company?company={company}&apikey={api_key}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise APIRequestError(response.status_code)
-    json_data = response.json()
+    json_data = get_json(url)
     return process_dataframe(json_data, *args, **kwargs) if as_pandas else json_data
@@ -1,10 +1,20 @@
 import os
-import json
+import copy
+import time
 import warnings
+import threading
+import numpy as np
 import pandas as pd
-from functools import wraps
+from collections import OrderedDict, namedtuple
+from functools import wraps, lru_cache
+from typing import Union
 from pandas import DataFrame
 
+from . import config
+from .config import api_key
+from .cache import is_bypassed
+from .schemas import compact_frame
+
 __author__ = 'Lukas Schröder'
 __date__ = '2023-08-05'
 __version__ = '0.1.0'
@@ -13,35 +23,21 @@ __doc__ = """
 This module is intended to store helper function used within all endpoint SDK modules.
 """
 
-paths = ["../config.json", "./config.json"]
-
-for path in paths:
-    if os.path.isfile(path):
-        with open(path) as config:
-            data = json.load(config)
-        break
-else:  # no break
-    raise FileNotFoundError("Could not find config.json in any of the specified paths")
-
-
-api_key = data['api_key']
-try:
-    output_path = data['output_path']
-except Exception as e:
-    output_path = None
-
 base_url_v3 = "https://financialmodelingprep.com/api/v3/"
 base_url_v4 = "https://financialmodelingprep.com/api/v4/"
 
 
 class APIRequestError(Exception):
 
-    def __init__(self, status_code):
+    def __init__(self, status_code, attempts: int = 1, body: str = None):
         self.status_code = status_code
+        self.attempts = attempts
+        self.body = body
         super().__init__(self.message)
 
     def __str__(self):
-        return f"APIRequestError: [Status Code: {self.status_code}] {self.message}"
+        attempts = f" after {self.attempts} attempts" if self.attempts > 1 else ""
+        return f"APIRequestError: [Status Code: {self.status_code}] {self.message}{attempts}"
 
     @property
     def message(self):
@@ -52,6 +48,8 @@ class APIRequestError(Exception):
             return 'This endpoint is only for users with Professional or Enterprise plan ' \
                    'please visit our subscription page to upgrade your plan' \
                    ' at https://financialmodelingprep.com/developer/docs/pricing'
+        elif self.status_code == 429:
+            return 'Limit reached. Lower the calls_per_minute in your config.json to the quota of your plan'
         else:
             return 'Unable to fetch the request'
 
@@ -63,6 +61,8 @@ def check_arguments(func):
     return wrapper
 
 
+# FMP's field vocabulary is small and stable, the memoized translators turn renaming into a dict lookup
+@lru_cache(maxsize=8192)
 def to_snake_case_ttm(column_name):
     result = []
     i = 0
@@ -79,6 +79,7 @@ def to_snake_case_ttm(column_name):
     return ''.join(result)
 
 
+@lru_cache(maxsize=8192)
 def to_snake_case(column_name):
     result = []
     i = 0
@@ -104,10 +105,8 @@ def to_snake_case(column_name):
 
 
 def convert_columns_to_snake_case(df, is_ttm=False):
-    if is_ttm:
-        df.columns = [to_snake_case_ttm(col) for col in df.columns]
-        return df
-    df.columns = [to_snake_case(col) for col in df.columns]
+    translate = to_snake_case_ttm if is_ttm else to_snake_case
+    df.columns = df.columns.map({col: translate(col) for col in df.columns})
     return df
 
 
@@ -156,76 +155,167 @@ def reverse_date_order(df):
     return df_sorted
 
 
+def _to_datetime_index(values, name) -> pd.Index:
+    try:
+        # FMP sends ISO 8601 dates, an explicit format skips the per-element format inference
+        return pd.DatetimeIndex(pd.to_datetime(values, format='ISO8601'), name=name)
+    except (ValueError, TypeError):
+        return pd.DatetimeIndex(pd.to_datetime(values), name=name)
+
+
 def process_dataframe(data, index_=None, ignore_=None, transpose_: bool = False,
                       save_=False, datatype_='csv', output_path_=None, filename_=None,
-                      format_=None, to_datetime: bool = True, reversed_: bool = False):
+                      format_=None, to_datetime: bool = True, reversed_: bool = False,
+                      compact: bool = False, schema_: str = None, compression_: str = None,
+                      partition_: Union[str, list] = None):
     if output_path_ is None:
-        output_path_ = output_path
+        output_path_ = config.get('output_path')
+    # pandas transposes the records into columns in a single pass in C, dtypes are inferred once per column.
+    # Everything below works in place on this one frame
     df = DataFrame(data)
-    df = convert_columns_to_snake_case(df)
-    if 'filling_date' in df.columns:
-        df.rename(columns={'filling_date': 'filing_date'}, inplace=True)
+    renamed = {col: to_snake_case(col) for col in df.columns}
+    renamed = {col: 'filing_date' if name == 'filling_date' else name for col, name in renamed.items()}
+    df.columns = df.columns.map(renamed)
+
     if index_ is not None:
         if df.empty:
             return df
         if index_ not in df.columns:
             raise AttributeError(f"Couldn't find {index_} in data columns")
-        df.set_index(index_, inplace=True)
-        if to_datetime and 'date' in index_:
-            df.index = pd.to_datetime(df.index)
+        parse_dates = to_datetime and 'date' in index_
     else:
+        date_cols = [col for col in df.columns if 'date' in col]
         if 'date' in df.columns:
-            df.set_index('date', inplace=True)
-            df.index = pd.to_datetime(df.index) if to_datetime else df.index
-        else:
-            for col in df.columns:
-                if 'date' in col:
-                    df.set_index(col, inplace=True)
-                    df.index = pd.to_datetime(df.index) if to_datetime else df.index
+            index_ = 'date'
+        elif len(date_cols) > 0:
+            # as with successive set_index calls, the last date column becomes the index
+            # and the other date columns are dropped
+            index_ = date_cols[-1]
+            for col in date_cols[:-1]:
+                del df[col]
+        parse_dates = to_datetime
+
+    if index_ is not None:
+        values = df.pop(index_)
+        df.index = _to_datetime_index(values, index_) if parse_dates else pd.Index(values, name=index_)
 
     if ignore_ is not None:
         df.drop(ignore_, axis=1, inplace=True)
-    if transpose_:
-        df = df.T
+    if compact:
+        df = compact_frame(df, schema_)
     if format_ is not None:
         df = format_number(df, format_)
+    records = df
+    if transpose_:
+        df = df.T
     if reversed_:
         df = reverse_date_order(df)
     if save_:
-        _save_frame(df, datatype_, output_path_, filename_)
+        # Arrow needs one dtype per column, while the columns of a transposed statement mix strings and numbers.
+        # Parquet and Feather files hold such frames in their record layout, one row per date
+        arrow = datatype_ in ('parquet', 'feather', 'arrow')
+        _save_frame(records if transpose_ and arrow else df, datatype_, output_path_, filename_,
+                    compression_, partition_)
     return df
 
 
-def _save_frame(df: DataFrame, datatype, output_path_, filename_):
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Saving as 'parquet' or 'feather' requires pyarrow, install it with 'pip install pyarrow'") from e
+    return pyarrow
+
+
+def _partition_frame(df: DataFrame, partition_: list) -> DataFrame:
+    # pyarrow partitions by columns, so index levels (e.g. symbol) are moved into the columns first.
+    # 'year' and 'month' are derived from a DatetimeIndex to partition by date without a directory per day
+    date_index = df.index.get_level_values(0) if isinstance(df.index, pd.MultiIndex) else df.index
+    for col in partition_:
+        if col in df.columns:
+            continue
+        if col in df.index.names:
+            df = df.reset_index(col)
+        elif col in ('year', 'month') and isinstance(date_index, pd.DatetimeIndex):
+            df = df.assign(**{col: getattr(date_index, col)})
+        else:
+            raise AttributeError(f"Couldn't find {col} in data columns or index")
+    return df
+
+
+def _save_frame(df: DataFrame, datatype, output_path_, filename_, compression_=None, partition_=None):
     output_path_ = os.path.join(output_path_, filename_ + '.' + datatype)
+    # a default RangeIndex carries no information, any other index (e.g. dates) is written as well
+    index = not isinstance(df.index, pd.RangeIndex)
     if datatype == 'csv':
-        df.to_csv(output_path_, index=False)
+        df.to_csv(output_path_, index=index, compression=compression_ or 'infer')
         print("Saved table as 'csv' to {}".format(output_path_))
 
     elif datatype == 'xlsx':
-        df.to_excel(output_path_, index=False, engine='openpyxl')
+        df.to_excel(output_path_, index=index, engine='openpyxl')
         print("Saved table as 'xlsx' to {}".format(output_path_))
 
     elif datatype == 'html':
-        df.to_html(output_path_, index=False)
+        df.to_html(output_path_, index=index)
         print("Saved table as 'html' to {}".format(output_path_))
+
+    elif datatype == 'parquet':
+        _import_pyarrow()
+        if partition_ is not None:
+            partition_ = [partition_] if isinstance(partition_, str) else list(partition_)
+            # written as a directory with one subdirectory per partition value
+            _partition_frame(df, partition_).to_parquet(output_path_, engine='pyarrow', index=index,
+                                                        compression=compression_ or 'snappy',
+                                                        partition_cols=partition_)
+        else:
+            df.to_parquet(output_path_, engine='pyarrow', index=index, compression=compression_ or 'snappy')
+        print("Saved table as 'parquet' to {}".format(output_path_))
+
+    elif datatype in ('feather', 'arrow'):
+        pyarrow = _import_pyarrow()
+        from pyarrow import feather
+        # DataFrame.to_feather only accepts a default index, the Arrow table keeps it in the pandas metadata
+        table = pyarrow.Table.from_pandas(df, preserve_index=index)
+        feather.write_feather(table, output_path_, compression=compression_ or 'lz4')
+        print("Saved table as '{}' to {}".format(datatype, output_path_))
     else:
-        raise TypeError(f"Invalid datatype {datatype}. Valid types are 'csv', 'xlsx', 'html'")
-
-
-def format_number(df, format_='mil'):
-    for index in df.index:
-        for col in df.columns:
-            val = df.at[index, col]
-            if isinstance(val, (int, float)):
-                if format_ == 'M' or 'mil':
-                    df.at[index, col] = f'{val / 1e6:.1f}'
-                elif format_ == 'B' or 'bil':
-                    df.at[index, col] = f'{val / 1e9:.1e}'
-                if df.at[index, col].endswith('0'):
-                    df.at[index, col] = int(float(df.at[index, col]))
-                else:
-                    df.at[index, col] = float(df.at[index, col])
+        raise TypeError(f"Invalid datatype {datatype}. "
+                        f"Valid types are 'csv', 'xlsx', 'html', 'parquet', 'feather', 'arrow'")
+
+
+_SCALES = {
+    'K': (1e3, 'K'), 'thousands': (1e3, 'K'),
+    'M': (1e6, 'M'), 'mil': (1e6, 'M'), 'millions': (1e6, 'M'),
+    'B': (1e9, 'B'), 'bil': (1e9, 'B'), 'billions': (1e9, 'B'),
+}
+
+
+def format_number(df: DataFrame, format_: str = 'mil', decimals: int = 1, as_string: bool = False) -> DataFrame:
+    """
+    Parameters
+    ----------
+    df: DataFrame to be scaled
+    format_: (str) 'K'/'thousands', 'M'/'mil'/'millions' or 'B'/'bil'/'billions'
+    decimals: (int) number of decimals to round to
+    as_string: (bool) renders the scaled numbers as strings with unit suffix, e.g. '394.3B'
+
+    Only numeric columns are scaled, in a single NumPy pass, all other columns are left untouched.
+    Apply it before transposing a statement, after the transpose all columns have dtype object.
+    """
+    if format_ not in _SCALES:
+        raise ValueError(f"Invalid format {format_}. Valid formats are {', '.join(_SCALES)}")
+    scale, suffix = _SCALES[format_]
+    numeric_cols = df.select_dtypes(include='number').columns
+    if len(numeric_cols) == 0:
+        return df
+    values = np.round(df[numeric_cols].to_numpy(dtype='float64') / scale, decimals)
+    if as_string:
+        rendered = np.char.add(np.char.mod(f'%.{decimals}f', values), suffix)
+        values = np.where(np.isnan(values), '', rendered).astype(object)
+    elif decimals <= 0 and not np.isnan(values).any():
+        values = values.astype('int64')
+    df = df.copy()
+    df[numeric_cols] = values
     return df
 
 
@@ -245,3 +335,67 @@ def not_implemented(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _defensive_copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+def memoize(maxsize: int = 128, ttl: float = 3600):
+    """
+    In-process LRU cache with time to live for reference-data endpoints that are called repeatedly.
+    Every call returns a copy of the cached value, so callers can't corrupt cached entries.
+    The decorated function exposes cache_info() with hit/miss stats and cache_clear().
+    Lookups are skipped inside fmpy.cache.bypass().
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        stats = {'hits': 0, 'misses': 0}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = (args, frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                # unhashable arguments, e.g. lists passed on to process_dataframe
+                return func(*args, **kwargs)
+            now = time.monotonic()
+            if not is_bypassed():
+                with lock:
+                    entry = entries.get(key)
+                    if entry is not None and entry[0] > now:
+                        entries.move_to_end(key)
+                        stats['hits'] += 1
+                        return _defensive_copy(entry[1])
+            value = func(*args, **kwargs)
+            with lock:
+                stats['misses'] += 1
+                entries[key] = (now + ttl, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return _defensive_copy(value)
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], maxsize, len(entries))
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+                stats['hits'] = stats['misses'] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,26 @@
+import pytest
+
+from fmpy import client
+from fmpy import config
+
+config.update(api_key='test')
+
+
+@pytest.fixture
+def transport():
+    """Serves fmpy.client.get_json with handler(url) -> json instead of HTTP, returns the requested URLs."""
+    tokens = []
+
+    def install(handler):
+        urls = []
+
+        def serve(url):
+            urls.append(url)
+            return handler(url)
+
+        tokens.append(client._transport.set(serve))
+        return urls
+
+    yield install
+    for token in reversed(tokens):
+        client._transport.reset(token)
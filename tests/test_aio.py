@@ -0,0 +1,77 @@
+import re
+import json
+import asyncio
+
+import pandas as pd
+
+from fmpy import aio
+from fmpy import config
+from fmpy import bulk
+from fmpy import client
+from fmpy import stock_price
+from fmpy.aio import stock_price as aio_stock_price
+
+
+config.update(api_key='test')
+
+
+def _respond(url: str) -> bytes:
+    if 'historical-price-full' in url:
+        symbols = re.search(r'historical-price-full/([^?]+)', url).group(1).split(',')
+        historical = [{'symbol': symbol, 'historical': [{'date': '2023-01-04', 'close': 2.0},
+                                                        {'date': '2023-01-03', 'close': 1.0}]}
+                      for symbol in symbols]
+        return json.dumps({'historicalStockList': historical} if len(symbols) > 1 else historical[0]).encode()
+    if 'quote' in url:
+        symbols = re.search(r'quote[^/]*/([^?]+)', url).group(1).split(',')
+        return json.dumps([{'symbol': symbol, 'price': 1.5, 'volume': 100} for symbol in symbols]).encode()
+    raise AssertionError(f"Unexpected request {url}")
+
+
+class _StandInClient(aio.AsyncClient):
+    # serves the requests from _respond and records them
+    def __init__(self):
+        super().__init__(max_concurrency=4)
+        self.urls = []
+
+    async def get_content(self, url: str) -> bytes:
+        self.urls.append(url)
+        await asyncio.sleep(0)
+        return _respond(url)
+
+
+def _run_sync(func, *args, **kwargs):
+    token = client._transport.set(lambda url: client.loads(_respond(url)))
+    try:
+        return func(*args, **kwargs)
+    finally:
+        client._transport.reset(token)
+
+
+def test_historical_panel_matches_sync():
+    tickers = [f"S{i}" for i in range(12)]
+    stand_in = _StandInClient()
+    df = asyncio.run(aio_stock_price.get_stock_historical_panel(tickers, '2023-01-01', client=stand_in))
+    expected = _run_sync(stock_price.get_stock_historical_panel, tickers, '2023-01-01')
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.shape == (2, 12)
+    # one request per chunk, all fetched in the same pass
+    assert len(stand_in.urls) == len(set(stand_in.urls)) == 3
+
+
+def test_quote_snapshot_matches_sync():
+    tickers = [f"S{i}" for i in range(450)]
+    stand_in = _StandInClient()
+    df = asyncio.run(aio_stock_price.get_quote_snapshot(tickers, client=stand_in))
+    expected = _run_sync(stock_price.get_quote_snapshot, tickers)
+    pd.testing.assert_frame_equal(df, expected)
+    assert len(df) == 450
+    assert len(stand_in.urls) == 3
+
+
+def test_bulk_map_is_served():
+    stand_in = _StandInClient()
+    results, errors = asyncio.run(aio.run(bulk.map, stock_price.get_real_time_price, ['A', 'B'], client=stand_in))
+    assert errors == {}
+    assert results == {'A': 1.5, 'B': 1.5}
+    assert len(stand_in.urls) == 2
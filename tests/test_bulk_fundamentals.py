@@ -0,0 +1,78 @@
+import re
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from fmpy import bulk_fundamentals
+
+
+def _statement(symbol: str, period: str, limit: int) -> list:
+    periods = ['Q4', 'Q3', 'Q2', 'Q1'] if period == 'quarter' else ['FY'] * 4
+    dates = ['2023-09-30', '2023-07-01', '2023-04-01', '2022-12-31']
+    return [{'date': date, 'symbol': symbol, 'reportedCurrency': 'USD', 'cik': '0000320193',
+             'fillingDate': date, 'acceptedDate': f"{date} 18:01:14", 'calendarYear': date[:4],
+             'period': label, 'revenue': 89498000000 + i, 'eps': 1.47, 'grossProfitRatio': None,
+             'link': 'https://www.sec.gov', 'finalLink': 'https://www.sec.gov'}
+            for i, (date, label) in enumerate(zip(dates, periods))][:limit]
+
+
+class _Statements:
+    """Stand-in of the statement endpoints, symbols in failing answer with an error payload."""
+
+    def __init__(self):
+        self.failing = set()
+
+    def __call__(self, url: str):
+        symbol = re.search(r'/([A-Z]+)\?', url).group(1)
+        if symbol in self.failing:
+            return {'Error Message': 'Limit Reach'}
+        period = re.search(r'period=(\w+)', url).group(1)
+        limit = int(re.search(r'limit=(\d+)', url).group(1))
+        return _statement(symbol, period, limit)
+
+
+@pytest.fixture
+def statements(transport):
+    statements = _Statements()
+    requested = transport(statements)
+    return statements, requested
+
+
+def test_to_long():
+    df = bulk_fundamentals._to_long(_statement('AAPL', 'quarter', 2), 'AAPL')
+    # gross profit ratio is missing, the metadata keys are no fields
+    assert sorted(df['field'].unique()) == ['eps', 'revenue']
+    assert len(df) == 4
+    assert df['value'].dtype == 'float64'
+    assert list(df.columns) == ['symbol', 'date', 'period', 'field', 'value']
+    assert bulk_fundamentals._to_long([], 'AAPL').empty
+
+
+def test_load_resume_and_read(tmp_path, statements):
+    stand_in, requested = statements
+    path = str(tmp_path)
+    stand_in.failing = {'MSFT'}
+    errors = bulk_fundamentals.load(['AAPL', 'MSFT'], path, statements=['income_statement', 'key_metrics'])
+    assert sorted(errors) == [('income_statement', 'MSFT'), ('key_metrics', 'MSFT')]
+    stand_in.failing = set()
+    requested.clear()
+    # only the failed pairs are requested again
+    assert bulk_fundamentals.load(['AAPL', 'MSFT'], path, statements=['income_statement', 'key_metrics']) == {}
+    assert len(requested) == 2 and all('MSFT' in url for url in requested)
+    df = bulk_fundamentals.read(path, statements=['income_statement'], symbols=['AAPL'])
+    assert set(df['statement']) == {'income_statement'}
+    assert set(df['symbol']) == {'AAPL'}
+    assert set(df['period']) == {'Q1', 'Q2', 'Q3', 'Q4'}
+    assert np.isin(['revenue', 'eps'], df['field']).all()
+
+
+def test_periods_and_limits_are_kept_apart(tmp_path, statements):
+    path = str(tmp_path)
+    assert bulk_fundamentals.load(['AAPL'], path, statements=['income_statement'], period='quarter', limit=4) == {}
+    assert bulk_fundamentals.load(['AAPL'], path, statements=['income_statement'], period='annual', limit=2) == {}
+    assert set(bulk_fundamentals.read(path, period='annual')['period']) == {'FY'}
+    assert set(bulk_fundamentals.read(path, period='quarter')['period']) == {'Q1', 'Q2', 'Q3', 'Q4'}
+    with pytest.raises(ValueError):
+        bulk_fundamentals.load(['AAPL'], path, statements=['income_statement'], period='quarter', limit=8)
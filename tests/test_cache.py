@@ -0,0 +1,47 @@
+import os
+import time
+
+from fmpy.cache import ResponseCache, canonical_url, DAY, HOUR
+
+BASE = 'https://financialmodelingprep.com/api/v3/'
+
+
+def test_ttl_uses_the_longest_matching_prefix(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttls={'quote': 1})
+    assert cache.ttl(f"{BASE}quote/AAPL?apikey=key") == 1
+    assert cache.ttl(f"{BASE}quote-short/AAPL?apikey=key") == 5
+    assert cache.ttl(f"{BASE}income-statement/AAPL?period=quarter&apikey=key") == DAY
+    assert cache.ttl(f"{BASE}historical-price-full/stock_split/AAPL?apikey=key") == HOUR
+    assert cache.ttl(f"{BASE}unknown-endpoint/AAPL?apikey=key") == cache.default_ttl
+
+
+def test_canonical_url_ignores_parameter_order_and_api_key():
+    assert canonical_url(f"{BASE}income-statement/AAPL?period=quarter&limit=4&apikey=one") == \
+        canonical_url(f"{BASE}/income-statement/AAPL?apikey=two&limit=4&period=quarter")
+    assert 'apikey' not in canonical_url(f"{BASE}profile/AAPL?apikey=key")
+
+
+def test_expired_entries_are_not_returned(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttls={'quote': 0.05})
+    url = f"{BASE}quote/AAPL?apikey=key"
+    cache.set(url, b'[{"symbol": "AAPL"}]')
+    assert cache.get(url) == b'[{"symbol": "AAPL"}]'
+    time.sleep(0.1)
+    assert cache.get(url) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    # random bytes don't compress, so every entry takes about 1000 bytes
+    cache = ResponseCache(str(tmp_path / 'cache.db'), max_size=2500)
+    urls = [f"{BASE}profile/{symbol}?apikey=key" for symbol in ('A', 'B', 'C')]
+    cache.set(urls[0], os.urandom(1000))
+    time.sleep(0.01)
+    cache.set(urls[1], os.urandom(1000))
+    time.sleep(0.01)
+    assert cache.get(urls[0]) is not None
+    time.sleep(0.01)
+    cache.set(urls[2], os.urandom(1000))
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[2]) is not None
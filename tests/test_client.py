@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from fmpy import client
+from fmpy.cache import ResponseCache
+from fmpy.utils import APIRequestError
+
+URL = 'https://financialmodelingprep.com/api/v3/profile/AAPL?apikey=key'
+
+
+class _StandInAdapter(BaseAdapter):
+    """Answers the requests with the queued (status, body) pairs, the last one repeatedly."""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.urls = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        status, body = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        response = Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def serve(tmp_path, monkeypatch):
+    client._init()
+    monkeypatch.setattr(client, '_settings', {**client._settings, 'max_retries': 2, 'backoff_factor': 0.})
+    monkeypatch.setattr(client, '_cache', ResponseCache(str(tmp_path / 'cache.db')))
+    monkeypatch.setattr(client, '_rate_limiter', None)
+    monkeypatch.setattr(client, '_session', None)
+
+    def mount(*responses):
+        adapter = _StandInAdapter(*responses)
+        client.get_session().mount('https://', adapter)
+        return adapter
+
+    yield mount
+    client.close()
+
+
+def test_transient_errors_are_retried(serve):
+    adapter = serve((503, {}), (502, {}), (200, [{'symbol': 'AAPL'}]))
+    assert client.get_json(URL) == [{'symbol': 'AAPL'}]
+    assert len(adapter.urls) == 3
+
+
+def test_retries_give_up(serve):
+    adapter = serve((503, {}))
+    with pytest.raises(APIRequestError) as error:
+        client.get_json(URL)
+    assert error.value.attempts == 3
+    assert len(adapter.urls) == 3
+
+
+def test_client_errors_are_not_retried(serve):
+    adapter = serve((401, {}))
+    with pytest.raises(APIRequestError):
+        client.get_json(URL)
+    assert len(adapter.urls) == 1
+
+
+def test_responses_are_cached(serve):
+    adapter = serve((200, [{'symbol': 'AAPL'}]))
+    assert client.get_json(URL) == client.get_json(URL.replace('apikey=key', 'apikey=other')) == [{'symbol': 'AAPL'}]
+    assert len(adapter.urls) == 1
+
+
+def test_error_payloads_are_not_cached(serve):
+    adapter = serve((200, {'Error Message': 'Limit Reach'}), (200, [{'symbol': 'AAPL'}]))
+    assert client.get_json(URL) == {'Error Message': 'Limit Reach'}
+    assert client.get_json(URL) == [{'symbol': 'AAPL'}]
+    assert len(adapter.urls) == 2
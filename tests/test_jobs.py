@@ -0,0 +1,33 @@
+from fmpy.jobs import JobRunner
+
+
+def _scale(symbol: str, factor: int = 1) -> str:
+    return symbol * factor
+
+
+def test_run_level_arguments_are_separate_units(tmp_path):
+    runner = JobRunner(str(tmp_path / 'jobs.db'), progress_interval=0)
+    assert runner.run(_scale, ['A', 'B']) == {}
+    assert runner.run(_scale, ['A', 'B'], factor=2) == {}
+    assert runner.results(_scale) == {'A': 'A', 'B': 'B'}
+    assert runner.results(_scale, factor=2) == {'A': 'AA', 'B': 'BB'}
+    assert runner.status(_scale, factor=2) == {'done': 2}
+
+
+def test_completed_units_are_skipped(tmp_path):
+    calls = []
+
+    def fetch(symbol: str) -> str:
+        calls.append(symbol)
+        if symbol == 'B' and calls.count('B') == 1:
+            raise ValueError(symbol)
+        return symbol.lower()
+
+    runner = JobRunner(str(tmp_path / 'jobs.db'), progress_interval=0)
+    errors = runner.run(fetch, ['A', 'B', 'C'])
+    assert list(errors) == ['[["B"], {}]']
+    assert runner.status(fetch) == {'done': 2, 'failed': 1}
+    # only the failed unit is run again
+    assert runner.run(fetch, ['A', 'B', 'C']) == {}
+    assert sorted(calls) == ['A', 'B', 'B', 'C']
+    assert runner.results(fetch) == {'A': 'a', 'B': 'b', 'C': 'c'}
@@ -0,0 +1,54 @@
+import time
+import threading
+
+import pytest
+
+from fmpy.pagination import paginate
+
+# 10 pages of 3 records, newest first, one day per record
+DATES = [f"2024-01-{day:02d}" for day in range(30, 0, -1)]
+
+
+class _Pages:
+    """Stand-in of a paginated endpoint, records the requested pages."""
+
+    def __init__(self, pages: int = 10):
+        self.pages = pages
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol: str, page: int = 0):
+        with self._lock:
+            self.requested.append(page)
+        if page >= self.pages:
+            return []
+        return [{'symbol': symbol, 'date': date} for date in DATES[page * 3:page * 3 + 3]]
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_pages_in_order_with_bounded_prefetch(prefetch):
+    pages = _Pages()
+    seen = []
+    for page, chunk in enumerate(paginate(pages, 'AAPL', prefetch=prefetch)):
+        # let the background requests run, at most prefetch pages are requested ahead
+        time.sleep(0.01)
+        assert max(pages.requested) == page + prefetch
+        seen.extend(record['date'] for record in chunk)
+    assert seen == DATES
+    assert sorted(pages.requested) == list(range(len(pages.requested)))
+
+
+def test_until_trims_the_last_page():
+    pages = _Pages()
+    chunks = list(paginate(pages, 'AAPL', until='2024-01-23'))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    assert chunks[-1][-1]['date'] == '2024-01-23'
+    # at most the page after the trimmed one was requested in the background
+    time.sleep(0.01)
+    assert max(pages.requested) <= 3
+
+
+def test_max_pages():
+    pages = _Pages()
+    assert len(list(paginate(pages, 'AAPL', start=2, max_pages=3, prefetch=2))) == 3
+    assert sorted(pages.requested) == [2, 3, 4]
@@ -0,0 +1,57 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpy.cache import is_bypassed
+from fmpy.poller import QuotePoller, _changed
+
+
+def test_changed():
+    previous = pd.DataFrame({'price': [1., 2., np.nan], 'volume': [10, 20, 30]}, index=['A', 'B', 'C'])
+    current = pd.DataFrame({'price': [1., 2.5, np.nan, 4.], 'volume': [11, 20, 30, 40]},
+                           index=['A', 'B', 'C', 'D'])
+    assert list(_changed(None, current, ['price'])) == ['A', 'B', 'C', 'D']
+    # missing values on both sides are no change, D is new
+    assert list(_changed(previous, current, ['price'])) == ['B', 'D']
+    assert list(_changed(previous, current, ['price', 'volume'])) == ['A', 'B', 'D']
+
+
+class _Quotes:
+    """Stand-in of the quote-short endpoint, the chunks containing a symbol in failing raise."""
+
+    def __init__(self, symbols):
+        self.prices = {symbol: 100. for symbol in symbols}
+        self.failing = set()
+        self.bypassed = []
+
+    def __call__(self, url: str):
+        self.bypassed.append(is_bypassed())
+        symbols = re.search(r'quote-short/([^?]+)', url).group(1).split(',')
+        if self.failing.intersection(symbols):
+            raise ConnectionError(url)
+        return [{'symbol': symbol, 'price': self.prices[symbol], 'volume': 1000} for symbol in symbols]
+
+
+@pytest.fixture
+def quotes(transport):
+    # two chunks of the default chunk size of 200 symbols
+    quotes = _Quotes([f"S{i:03d}" for i in range(250)])
+    transport(quotes)
+    return quotes
+
+
+def test_failed_chunk_is_not_reported_as_new(quotes):
+    changes = []
+    poller = QuotePoller(list(quotes.prices), callback=changes.append)
+    assert len(poller.poll()) == 250
+    quotes.failing = {'S249'}
+    quotes.prices['S000'] = 101.
+    with pytest.warns(UserWarning):
+        assert list(poller.poll().index) == ['S000']
+    assert len(poller.snapshot) == 250
+    quotes.failing = set()
+    assert poller.poll().empty
+    assert [len(change) for change in changes] == [250, 1]
+    assert all(quotes.bypassed)
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+from fmpy.price_store import PriceStore
+
+
+class _History:
+    """Stand-in of the historical price and split endpoints of one symbol."""
+
+    def __init__(self, bars: dict):
+        self.bars = dict(bars)
+        self.splits = []
+        self.empty = False
+
+    def __call__(self, url: str):
+        if 'stock_split' in url:
+            return {'symbol': 'AAPL', 'historical': [{'date': date} for date in self.splits]}
+        if self.empty:
+            return {}
+        from_ = re.search(r'from=([\d-]+)', url).group(1)
+        historical = [{'date': date, 'close': close} for date, close in sorted(self.bars.items(), reverse=True)
+                      if date >= from_]
+        return {'symbol': 'AAPL', 'historical': historical}
+
+
+@pytest.fixture
+def history(transport):
+    history = _History({'2024-01-02': 100., '2024-01-03': 102.})
+    transport(history)
+    return history
+
+
+def test_delta_appends_new_bars(tmp_path, history):
+    store = PriceStore(str(tmp_path))
+    assert store.sync('AAPL')['close'].tolist() == [100., 102.]
+    history.bars.update({'2024-01-04': 103., '2024-01-05': 101.})
+    df = store.sync('AAPL')
+    assert df['close'].tolist() == [100., 102., 103., 101.]
+    assert df.index.is_monotonic_increasing
+    assert store.load('AAPL').equals(df)
+
+
+def test_empty_delta_keeps_the_store(tmp_path, history):
+    store = PriceStore(str(tmp_path))
+    store.sync('AAPL')
+    history.empty = True
+    for _ in range(3):
+        assert store.sync('AAPL')['close'].tolist() == [100., 102.]
+    assert len(store.load('AAPL')) == 2
+
+
+def test_split_pulls_the_full_history(tmp_path, history):
+    store = PriceStore(str(tmp_path))
+    store.sync('AAPL')
+    history.splits = ['2024-01-04']
+    history.bars = {'2024-01-02': 50., '2024-01-03': 51., '2024-01-04': 52.}
+    assert store.sync('AAPL')['close'].tolist() == [50., 51., 52.]
+
+
+def test_empty_full_pull_keeps_the_store(tmp_path, history):
+    store = PriceStore(str(tmp_path))
+    store.sync('AAPL')
+    history.splits = ['2024-01-04']
+    history.empty = True
+    with pytest.raises(ValueError):
+        store.sync('AAPL')
+    results, errors = store.sync_many(['AAPL'])
+    assert list(errors) == ['AAPL']
+    assert store.load('AAPL')['close'].tolist() == [100., 102.]
@@ -0,0 +1,17 @@
+import pytest
+
+from fmpy.rate_limit import TokenBucket
+
+
+def test_burst_then_plan_rate():
+    bucket = TokenBucket(calls_per_minute=60, burst=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[:2] == [0., 0.]
+    # one token per second, the callers queue up behind each other
+    assert delays[2] == pytest.approx(1., abs=0.05)
+    assert delays[3] == pytest.approx(2., abs=0.05)
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(calls_per_minute=0)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from fmpy.utils import process_dataframe
+from fmpy.schemas import compact_frame, _fits_float32
+
+QUOTES = [
+    {'symbol': 'AAPL', 'name': 'Apple Inc.', 'price': 193.58, 'changesPercentage': -0.5447, 'change': -1.06,
+     'dayLow': 192.72, 'dayHigh': 194.4, 'yearHigh': 199.62, 'yearLow': 164.08, 'marketCap': 2912345678901,
+     'priceAvg50': 189.7428, 'priceAvg200': 181.2231, 'exchange': 'NASDAQ', 'volume': 42628822,
+     'avgVolume': 53838744, 'open': 194.14, 'previousClose': 194.64, 'eps': 6.13, 'pe': 31.58,
+     'earningsAnnouncement': '2024-01-25T21:30:00.000+0000', 'sharesOutstanding': 15552752000,
+     'timestamp': 1703278801},
+    {'symbol': 'MSFT', 'name': 'Microsoft Corporation', 'price': 374.58, 'changesPercentage': 0.2783,
+     'change': 1.04, 'dayLow': 372.71, 'dayHigh': 375.18, 'yearHigh': 384.3, 'yearLow': 219.35,
+     'marketCap': 2784084127800, 'priceAvg50': 370.2156, 'priceAvg200': 323.1203, 'exchange': 'NASDAQ',
+     'volume': 17091149, 'avgVolume': 26124486, 'open': 373.68, 'previousClose': 373.54, 'eps': 10.32,
+     'pe': 36.3, 'earningsAnnouncement': None, 'sharesOutstanding': 7432540000, 'timestamp': 1703278801},
+]
+
+INCOME_STATEMENTS = [
+    {'date': '2023-09-30', 'symbol': 'AAPL', 'reportedCurrency': 'USD', 'period': 'FY',
+     'revenue': 383285000000, 'grossProfitRatio': 0.4413112958, 'eps': 6.16, 'weightedAverageShsOut': 15744231000},
+    {'date': '2022-09-24', 'symbol': 'AAPL', 'reportedCurrency': 'USD', 'period': 'FY',
+     'revenue': 394328000000, 'grossProfitRatio': 0.4330963056, 'eps': 6.15, 'weightedAverageShsOut': 16215963000},
+    # a missing amount turns the integer column into float64
+    {'date': '2021-09-25', 'symbol': 'AAPL', 'reportedCurrency': 'USD', 'period': 'FY',
+     'revenue': None, 'grossProfitRatio': 0.4177935962, 'eps': 5.67, 'weightedAverageShsOut': 16701272000},
+]
+
+
+def test_quotes_schema():
+    df = process_dataframe(QUOTES, index_='symbol', compact=True, schema_='quotes')
+    assert df['earnings_announcement'].dtype == 'datetime64[ns]'
+    assert df.loc['AAPL', 'earnings_announcement'] == pd.Timestamp('2024-01-25 21:30')
+    assert pd.isna(df.loc['MSFT', 'earnings_announcement'])
+    assert df['price'].dtype == 'float32'
+    assert df['volume'].dtype == 'int32'
+    assert df['market_cap'].dtype == 'float64'
+    assert df.loc['AAPL', 'market_cap'] == 2912345678901
+    assert isinstance(df['exchange'].dtype, pd.CategoricalDtype)
+
+
+def test_generic_downcast_keeps_large_amounts():
+    df = process_dataframe(INCOME_STATEMENTS, compact=True)
+    assert df['revenue'].dtype == 'float64'
+    assert df['revenue'].tolist()[:2] == [383285000000, 394328000000]
+    assert df['weighted_average_shs_out'].dtype == 'int64'
+    assert df['eps'].dtype == 'float32'
+    # ratios with 10 significant digits stay exact
+    assert df['gross_profit_ratio'].dtype == 'float64'
+    assert df['period'].dtype == 'category'
+
+
+def test_fits_float32():
+    assert _fits_float32(np.array([193.58, 0.1, -1.06, np.nan]))
+    assert _fits_float32(np.array([4262882., 0.]))
+    assert not _fits_float32(np.array([2912345678901., 1.]))
+    assert not _fits_float32(np.array([394328000000.]))
+    assert not _fits_float32(np.array([0.4413112958]))
+
+
+def test_compact_frame_keeps_values():
+    df = pd.DataFrame({'price': [193.58, 374.58], 'market_cap': [2912345678901., 2784084127800.]})
+    compact = compact_frame(df.copy())
+    np.testing.assert_allclose(compact['price'].to_numpy(), df['price'].to_numpy(), rtol=1e-7)
+    assert compact['market_cap'].tolist() == df['market_cap'].tolist()
@@ -0,0 +1,74 @@
+import pytest
+
+from fmpy.screener import Screener
+
+
+def _quote(symbol: str, price: float, market_cap: int, exchange: str) -> dict:
+    return {'symbol': symbol, 'name': symbol, 'price': price, 'changesPercentage': 0.5, 'change': 1.,
+            'dayLow': price, 'dayHigh': price, 'yearHigh': price, 'yearLow': price, 'marketCap': market_cap,
+            'priceAvg50': price, 'priceAvg200': price, 'exchange': exchange, 'volume': 1000, 'avgVolume': 1000,
+            'open': price, 'previousClose': price, 'eps': 5.5, 'pe': price / 5.5,
+            'earningsAnnouncement': '2024-01-25T21:30:00.000+0000', 'sharesOutstanding': 1000000,
+            'timestamp': 1703278801}
+
+
+QUOTES = {
+    'nyse': [_quote('XOM', 104.5, 415000000000, 'NYSE'), _quote('DVN', 45.3, 28900000000, 'NYSE')],
+    'nasdaq': [_quote('AAPL', 193.58, 2912345678901, 'NASDAQ'), _quote('FANG', 155.1, 27600000000, 'NASDAQ')],
+}
+
+PROFILES = [
+    {'symbol': 'XOM', 'companyName': 'Exxon Mobil', 'marketCap': 415000000000, 'sector': 'Energy',
+     'industry': 'Oil & Gas Integrated', 'beta': 0.9, 'price': 104.5, 'lastAnnualDividend': 3.8,
+     'volume': 1000, 'exchange': 'New York Stock Exchange', 'exchangeShortName': 'NYSE', 'country': 'US',
+     'isEtf': False, 'isActivelyTrading': True},
+    {'symbol': 'DVN', 'companyName': 'Devon Energy', 'marketCap': 28900000000, 'sector': 'Energy',
+     'industry': 'Oil & Gas E&P', 'beta': 2.1, 'price': 45.3, 'lastAnnualDividend': 2.9, 'volume': 1000,
+     'exchange': 'New York Stock Exchange', 'exchangeShortName': 'NYSE', 'country': 'US', 'isEtf': False,
+     'isActivelyTrading': True},
+    {'symbol': 'AAPL', 'companyName': 'Apple', 'marketCap': 2912345678901, 'sector': 'Technology',
+     'industry': 'Consumer Electronics', 'beta': 1.3, 'price': 193.58, 'lastAnnualDividend': 0.96,
+     'volume': 1000, 'exchange': 'NASDAQ Global Select', 'exchangeShortName': 'NASDAQ', 'country': 'US',
+     'isEtf': False, 'isActivelyTrading': True},
+    {'symbol': 'FANG', 'companyName': 'Diamondback Energy', 'marketCap': 27600000000, 'sector': 'Energy',
+     'industry': 'Oil & Gas E&P', 'beta': 1.9, 'price': 155.1, 'lastAnnualDividend': 3.4, 'volume': 1000,
+     'exchange': 'NASDAQ Global Select', 'exchangeShortName': 'NASDAQ', 'country': 'US', 'isEtf': False,
+     'isActivelyTrading': True},
+]
+
+
+def _respond(url: str):
+    if 'stock-screener' in url:
+        return PROFILES
+    exchange = url.split('quotes/')[1].split('?')[0]
+    return QUOTES[exchange]
+
+
+@pytest.fixture
+def screener(tmp_path, transport):
+    transport(_respond)
+    return Screener(exchanges=['nyse', 'nasdaq'], path=str(tmp_path / 'universe.pkl'))
+
+
+def test_refresh_and_screen(screener):
+    frame = screener.refresh()
+    assert sorted(frame.index) == ['AAPL', 'DVN', 'FANG', 'XOM']
+    assert frame.loc['AAPL', 'market_cap'] == 2912345678901
+    df = screener.screen(market_cap_more_than=2.8e10, sector='Energy', sort_by='market_cap')
+    assert list(df.index) == ['XOM', 'DVN']
+    df = screener.screen(industry='Oil & Gas E&P', dividend_more_than=3, exchange=['NYSE', 'NASDAQ'])
+    assert list(df.index) == ['FANG']
+
+
+def test_snapshot_is_loaded_from_disk(screener, transport):
+    screener.refresh()
+    requested = transport(_respond)
+    reloaded = Screener(exchanges=['nyse', 'nasdaq'], path=screener.path)
+    assert list(reloaded.screen(beta_lower_than=1).index) == ['XOM']
+    assert requested == []
+
+
+def test_unknown_column(screener):
+    screener.refresh()
+    with pytest.raises(AttributeError):
+        screener.screen(moat_more_than=1)
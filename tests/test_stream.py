@@ -0,0 +1,115 @@
+import json
+import time
+import asyncio
+import threading
+
+import pytest
+
+websockets = pytest.importorskip('websockets')
+
+from fmpy import client
+from fmpy import config
+from fmpy.stream import StreamClient
+
+
+config.update(api_key='test')
+client.configure(backoff_factor=0.01)
+
+
+class _StandInServer:
+    """Local stand-in of an FMP feed, sends ticks of the subscribed symbols and drops every connection after
+    ticks_per_connection ticks."""
+
+    def __init__(self, ticks_per_connection: int = 10, malformed: bool = False):
+        self.ticks_per_connection = ticks_per_connection
+        self.malformed = malformed
+        self.messages = []
+
+    async def handler(self, websocket):
+        symbols = set()
+        async for raw in websocket:
+            message = json.loads(raw)
+            self.messages.append(message)
+            if message['event'] == 'login':
+                await websocket.send(json.dumps({'event': 'login', 'status': 200, 'message': 'Authenticated'}))
+                if self.malformed:
+                    await websocket.send('not json')
+            elif message['event'] == 'subscribe':
+                symbols.update(message['data']['ticker'])
+                break
+        for n in range(self.ticks_per_connection):
+            for symbol in sorted(symbols):
+                await websocket.send(json.dumps({'s': symbol, 't': n, 'type': 'T', 'lp': 100. + n}))
+            await asyncio.sleep(0.001)
+        await websocket.close()
+
+    def events(self, event: str) -> list:
+        return [message for message in self.messages if message['event'] == event]
+
+
+async def _collect(stream: StreamClient, count: int) -> list:
+    ticks = []
+    async for tick in stream:
+        ticks.append(tick)
+        if len(ticks) >= count:
+            break
+    return ticks
+
+
+def _stream(server: _StandInServer, count: int, callbacks=(), **kwargs):
+    async def main():
+        async with websockets.serve(server.handler, 'localhost', 0) as listener:
+            port = listener.sockets[0].getsockname()[1]
+            stream = StreamClient(url=f"ws://localhost:{port}", **kwargs)
+            for callback in callbacks:
+                stream.add_callback(callback)
+            return stream, await asyncio.wait_for(_collect(stream, count), 5)
+
+    return asyncio.run(main())
+
+
+def test_reconnect_and_resubscribe():
+    server = _StandInServer(ticks_per_connection=10)
+    stream, ticks = _stream(server, 25, symbols=['AAPL', 'msft'], buffer_size=4)
+    assert len(ticks) == 25
+    assert {tick['s'] for tick in ticks} == {'aapl', 'msft'}
+    # 10 ticks per symbol and connection, so the client reconnected and subscribed again
+    assert len(server.events('login')) >= 2
+    assert all(message['data']['ticker'] == ['aapl', 'msft'] for message in server.events('subscribe'))
+    assert len(stream.recent('AAPL')) == 4
+    assert stream.recent('aapl', as_pandas=True).shape[0] == 4
+
+
+def test_failing_callback_and_malformed_frames_keep_the_stream():
+    def fail(tick):
+        raise ValueError(tick)
+
+    received = []
+    server = _StandInServer(ticks_per_connection=20, malformed=True)
+    stream, ticks = _stream(server, 15, callbacks=[fail, received.append], symbols=['btcusd'])
+    assert len(ticks) == 15
+    assert len(received) >= 15
+    assert len(server.events('login')) == 1
+
+
+def test_stop_right_after_start():
+    server = _StandInServer(ticks_per_connection=1000)
+
+    async def serve(ready, done):
+        async with websockets.serve(server.handler, 'localhost', 0) as listener:
+            ready.append(listener.sockets[0].getsockname()[1])
+            while not done:
+                await asyncio.sleep(0.01)
+
+    ready, done = [], []
+    thread = threading.Thread(target=asyncio.run, args=(serve(ready, done),), daemon=True)
+    thread.start()
+    while not ready:
+        time.sleep(0.01)
+    stream = StreamClient(url=f"ws://localhost:{ready[0]}", symbols=['aapl'])
+    for _ in range(20):
+        stream.start()
+        stream.stop(timeout=5)
+        assert stream._thread is None
+        assert not stream.connected
+    done.append(True)
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from fmpy.utils import process_dataframe
+
+INCOME_STATEMENTS = [
+    {'date': '2023-09-30', 'symbol': 'AAPL', 'reportedCurrency': 'USD', 'period': 'FY',
+     'revenue': 383285000000, 'grossProfitRatio': 0.4413112958, 'eps': 6.16},
+    {'date': '2022-09-24', 'symbol': 'AAPL', 'reportedCurrency': 'USD', 'period': 'FY',
+     'revenue': 394328000000, 'grossProfitRatio': 0.4330963056, 'eps': 6.15},
+]
+
+
+@pytest.mark.parametrize('datatype', ['parquet', 'feather'])
+def test_save_transposed_statement(tmp_path, datatype):
+    pytest.importorskip('pyarrow')
+    df = process_dataframe(INCOME_STATEMENTS, transpose_=True, save_=True, datatype_=datatype,
+                           output_path_=str(tmp_path), filename_='income')
+    assert df.loc['revenue', pd.Timestamp('2023-09-30')] == 383285000000
+    file = tmp_path / f"income.{datatype}"
+    saved = pd.read_parquet(file) if datatype == 'parquet' else pd.read_feather(file)
+    # one row per date with numeric dtypes
+    assert list(saved.index) == [pd.Timestamp('2023-09-30'), pd.Timestamp('2022-09-24')]
+    assert saved['revenue'].tolist() == [383285000000, 394328000000]
+    assert saved['eps'].dtype == 'float64'
+    assert saved['symbol'].tolist() == ['AAPL', 'AAPL']
+
+
+def test_save_csv_keeps_the_returned_layout(tmp_path):
+    df = process_dataframe(INCOME_STATEMENTS, transpose_=True, save_=True, datatype_='csv',
+                           output_path_=str(tmp_path), filename_='income')
+    saved = pd.read_csv(tmp_path / 'income.csv', index_col=0)
+    assert saved.shape == df.shape